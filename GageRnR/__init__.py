@@ -2,16 +2,27 @@
 
 This module
 - contains Gauge RnR logic
+
+Importing it only loads numpy, the plotting, regression and CLI
+dependencies are imported when they are first used.
 """
 from .gageRnR import GageRnR
+from .cellStatistics import CellStatistics
 from .generator import Distribution, Settings, Generator
-from .__main__ import main
 from .dataLoader import DataLoader
+from .dataCache import DataCache
+from .dataset import Dataset
+from .lazyResult import LazyResult
+from .resultTable import ResultTable
 from .statistics import Statistics, Result, Component
 from .normality import Normality
 from .linearity import Linearity
+from .bootstrap import Bootstrap
+from .simulator import Simulator
+from .groupBy import GroupBy
 
 __all__ = ['GageRnR',
+           'CellStatistics',
            'Component',
            'Result',
            'Distribution',
@@ -19,9 +30,30 @@ __all__ = ['GageRnR',
            'Generator',
            'main',
            'DataLoader',
+           'DataCache',
+           'Dataset',
+           'LazyResult',
+           'ResultTable',
            'Statistics',
            'Normality',
-           'Linearity', ]
+           'Linearity',
+           'Bootstrap',
+           'Simulator',
+           'GroupBy',
+           'Server', ]
+
+# Attributes imported on first access, they pull in the CLI and server.
+Lazy = {'main': '.__main__', 'Server': '.server'}
+
+
+def __getattr__(name):
+    if name not in Lazy:
+        raise AttributeError("module 'GageRnR' has no attribute " + repr(name))
+    import importlib
+    value = getattr(importlib.import_module(Lazy[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
 __version__ = "0.8.0"
 __version_info__ = tuple(
@@ -12,10 +12,16 @@ m1    m2    m3
 3.04, 2.89, 2.85  # p1 | o3
 1.62, 1.87, 2.04  # p2
 
+Binary .npy files and raw .raw/.bin files holding the values in
+the same order are memory mapped instead of parsed.
+
 More info: https://github.com/owodunni/GageRnR
 
 Usage:
-    GageRnR -f FILE -s STRUCTURE [-a <AXES>] [-d <DELIMITER>] [-m <SCALAR>] [-o <FOLDER>] [-g <PARTS>]
+    GageRnR (-f FILE | -b INPUTS) -s STRUCTURE [-a <AXES>] [-d <DELIMITER>] [-m <SCALAR>] [-o <FOLDER>] [options]
+    GageRnR (-f FILE | -b INPUTS) -w [-d <DELIMITER>] [-m <SCALAR>] [-o <FOLDER>] [options]
+    GageRnR (-f FILE | -b INPUTS) -k <COLUMN> [-d <DELIMITER>] [-m <SCALAR>] [-o <FOLDER>] [options]
+    GageRnR --serve [options]
     GageRnR -h | --help
     GageRnR -v | --version
 
@@ -24,21 +30,65 @@ Examples:
     GageRnR -f data/data_mXop.csv -s 3,5,11 -o outDir
     GageRnR -f data/data_opXm.csv -s 5,7,11 -a 2,1,0 -o outDir
     GageRnR -f data/data_demoGRnR.csv -s 3,10,3 -a 0,2,1 -g 40,42,30,43,29,45,27.5,42,26,35 -o outDir
+    GageRnR -f data/data_mXop.csv -s 3,5,11 -l 64 -o outDir
+    GageRnR -f data/data_mXop.csv -s 3,5,11 -t float32 -o outDir
+    GageRnR -f data.npy -s 3,5,11 -o outDir
+    GageRnR -f data/data_mXop.csv -s 3,5,11 -c .cache -o outDir
+    GageRnR -f characteristics.csv -w -o outDir
+    GageRnR -f gauges.csv -k gauge -j 4 -o outDir
+    GageRnR -b "data/data_*.csv" -s 3,5,11 -j 4 -o outDir
+    GageRnR --serve --port 8080 -j 4
 
 Options:
     -f --file=FILE Load input data.
+    -b --batch=INPUTS Analyse many files in one run, INPUTS is a
+        directory, a glob pattern or a manifest file listing one file
+        per line. Every report is written to a sub folder of the output
+        folder, which also gets an index of all studies.
     -s --structure=STRUCTURE Data structure.
         Order should be operators, parts, measurements.
+    -w --wide  FILE starts with a header row, every row holds the
+        operator, part and replicate followed by one value per
+        characteristic. All characteristics are analysed in one pass
+        and reported in one table.
+    -k --groupBy=<COLUMN>  FILE starts with a header row, COLUMN names
+        the column holding the group of every row and the other columns
+        hold the operator, part, replicate and value in that order.
+        Every group is analysed and all are reported in one table
+        sorted by %GRR.
+    -j --jobs=<N>  Number of worker processes analysing the groups
+        or the batch of files, or rendering the plots of a report.
     -a --axes=<AXES>  Order of data axes [default: 0,1,2].
     -d --delimiter=<DELIMITER>  Order of data axes [default: ,].
     -m --multiply=<SCALAR>  Multiplies the data with a scalar [default: 1].
     -o --output=<FOLDER> Report output directory
     -g --groundTruth=<PARTS> Ground Truth data for parts
+        With -k in order of the part labels sorted.
+    -l --memoryLimit=<MB> Analyse the file out-of-core in chunks using
+        about MB megabytes of memory. Only Gauge R&R and Statistics
+        are calculated since the raw data is never held in memory.
+    -t --dtype=<DTYPE> Floating point type of the loaded data, float32
+        halves the memory while results are still accumulated in
+        float64 [default: float64].
+    -c --cache=<FOLDER> Cache the parsed data in FOLDER, reruns with the
+        same file and options skip parsing.
+    --cacheSize=<MB> Evict the least recently used cached data when the
+        cache grows beyond MB megabytes [default: 1024].
+    --serve  Keep the library loaded and analyse studies posted to
+        http://HOST:PORT/analyse, see GageRnR.server.
+    --host=<HOST>  Address the server listens on [default: 127.0.0.1].
+    --port=<PORT>  Port the server listens on [default: 8080].
+    --socket=<PATH>  Listen on a Unix socket instead.
     -h --help     Show this screen.
     -v --version  Show version.
 """
-from docopt import docopt
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import glob
+import html
 import os.path
+from docopt import docopt
+from tabulate import tabulate
 
 import GageRnR
 from .reportGenerator import ReportGenerator
@@ -66,15 +116,86 @@ def checkIntegerList(name, values, minValue=0):
         raise AttributeError(name, " can only be positive integers.")
 
 
+def batchFiles(inputs):
+    """Files of a directory, glob pattern or manifest file.
+
+    A manifest lists one file per line relative to the manifest,
+    blank lines and lines starting with # are skipped.
+    """
+    if os.path.isdir(inputs):
+        return sorted(
+            os.path.join(inputs, name) for name in os.listdir(inputs)
+            if not name.startswith('.') and os.path.isfile(os.path.join(inputs, name)))
+    if os.path.isfile(inputs):
+        folder = os.path.dirname(inputs)
+        with open(inputs) as f:
+            lines = [line.strip() for line in f]
+        return [
+            os.path.join(folder, line) for line in lines
+            if line and not line.startswith('#')]
+    return sorted(path for path in glob.glob(inputs) if os.path.isfile(path))
+
+
+def studyNames(files):
+    """Unique name of the study in every file."""
+    names = []
+    taken = set()
+    for file in files:
+        name = os.path.splitext(os.path.basename(file))[0]
+        unique = name
+        counter = 2
+        while unique in taken:
+            unique = name + '_' + str(counter)
+            counter += 1
+        names.append(unique)
+        taken.add(unique)
+    return names
+
+
+def runStudy(application, file, outputFolder=None):
+    """Analyse one file of a batch.
+
+    :param Application application: Options of the study, see Application.studyOptions.
+    :returns: File, %GRR and error of the study as a row of the index.
+    """
+    application = copy.copy(application)
+    application.file = file
+    if outputFolder is not None:
+        application.outputFolder = outputFolder
+    try:
+        application.check()
+        result = application.run()
+    except Exception as error:
+        return [file, '', str(error)]
+
+    percent = ''
+    if isinstance(result, GageRnR.GageRnR) and not result.batch:
+        percent = format(float(result.result[GageRnR.Result.Percent][GageRnR.GageRnR.GRR]), '.3f')
+    return [file, percent, '']
+
+
 class Application():
 
     def __init__(self, argv=None):
         arguments = docopt(__doc__, argv, version=GageRnR.__version__)
-        self.file = str(arguments["--file"])
-        self.structure = toInt(arguments["--structure"])
+        self.file = arguments["--file"]
+        self.serve = arguments["--serve"]
+        if self.serve:
+            self.host = arguments["--host"]
+            self.port = int(arguments["--port"])
+            self.socket = arguments["--socket"]
+        self.batch = arguments["--batch"]
+        self.wide = arguments["--wide"]
+        self.groupBy = arguments["--groupBy"]
+        self.jobs = None
+        if(arguments["--jobs"] is not None):
+            self.jobs = int(arguments["--jobs"])
+        if(arguments["--structure"] is not None):
+            self.structure = toInt(arguments["--structure"])
         self.axes = toInt(arguments["--axes"])
         self.delimiter = str(arguments["--delimiter"])
         self.scalar = float(arguments["--multiply"])
+        self.dtype = str(arguments["--dtype"])
 
         if(arguments["--groundTruth"] is not None):
             self.gt = toFloat(arguments["--groundTruth"])
@@ -82,21 +203,210 @@ class Application():
         if(arguments["--output"] is not None):
             self.outputFolder = arguments["--output"]
 
+        if(arguments["--memoryLimit"] is not None):
+            self.memoryLimit = int(float(arguments["--memoryLimit"]) * 2**20)
+
+        if(arguments["--cache"] is not None):
+            self.cache = GageRnR.DataCache(
+                arguments["--cache"],
+                int(float(arguments["--cacheSize"]) * 2**20))
+
     def check(self):
-        if not os.path.isfile(self.file):
+        if self.serve:
+            return
+        if self.batch is not None:
+            self.files = batchFiles(self.batch)
+            if not self.files:
+                raise FileNotFoundError(self.batch)
+        elif not os.path.isfile(self.file):
             raise FileNotFoundError(self.file)
-        checkIntegerList("Structure", self.structure, 1)
-        checkIntegerList("Axes", self.axes)
+        if not self.wide and self.groupBy is None:
+            checkIntegerList("Structure", self.structure, 1)
+            checkIntegerList("Axes", self.axes)
+        if self.dtype not in ['float32', 'float64']:
+            raise AttributeError("Dtype can only be float32 or float64.")
 
-    def run(self):
+    def load(self):
         loader = GageRnR.DataLoader()
+        if hasattr(self, 'memoryLimit'):
+            cells = loader.loadCells(
+                file=self.file,
+                structure=self.structure,
+                axes=self.axes,
+                delimiter=self.delimiter,
+                memoryLimit=self.memoryLimit,
+                dtype=self.dtype)
+            return cells.scale(self.scalar)
+
+        if hasattr(self, 'cache') and not loader.isBinary(self.file):
+            return self.cache.load(
+                self.file,
+                self.options(),
+                lambda: self.loadData(loader))
+
+        return self.loadData(loader)
+
+    def loadData(self, loader):
         data = loader.load(
             file=self.file,
             structure=self.structure,
             axes=self.axes,
-            delimiter=self.delimiter)
+            delimiter=self.delimiter,
+            dtype=self.dtype)
+
+        # Memory mapped data is read only and only copied when scaled.
+        if self.scalar != 1:
+            data = data * self.scalar
+        return data
+
+    def options(self):
+        """Options the loaded data depends on."""
+        return {
+            'structure': self.structure,
+            'axes': self.axes,
+            'delimiter': self.delimiter,
+            'multiply': self.scalar,
+            'dtype': self.dtype}
+
+    def reportGenerator(self):
+        return ReportGenerator(
+            self.outputFolder, getattr(self, 'assetFolder', None), processes=self.jobs)
+
+    def loadWide(self):
+        data, labels = GageRnR.DataLoader().loadWide(
+            file=self.file,
+            delimiter=self.delimiter,
+            dtype=self.dtype)
+        if self.scalar != 1:
+            data = data * self.scalar
+        return data, labels
+
+    def runWide(self):
+        data, labels = self.loadWide()
+        g = GageRnR.GageRnR(data, labels)
+        g.calculate()
+
+        if not hasattr(self, 'outputFolder'):
+            return g
+
+        rg = self.reportGenerator()
+        rg.addTitle(g.title)
+        rg.addDoc(g)
+        rg.addTable(g.studySummary(
+            names=labels['Characteristic'],
+            tableFormat="html",
+            header='Characteristic'))
+        rg.generateReport()
+
+        print("Report written to: " + self.outputFolder)
+        return g
+
+    def loadGroups(self):
+        loader = GageRnR.DataLoader()
+        header = loader.header(self.file, self.delimiter)
+        key = int(self.groupBy) if self.groupBy.isdigit() else header.index(self.groupBy)
+        columns = [i for i in range(len(header)) if i != key][:4]
+        groups = loader.loadGroups(
+            file=self.file,
+            delimiter=self.delimiter,
+            key=key,
+            columns=columns,
+            skiprows=1,
+            dtype=self.dtype)
+        if self.scalar != 1:
+            for name, (data, labels) in groups.items():
+                groups[name] = (data * self.scalar, labels)
+        return groups
+
+    def runGroups(self):
+        gb = GageRnR.GroupBy(
+            self.loadGroups(),
+            partGt=getattr(self, 'gt', None),
+            processes=self.jobs)
+        gb.calculate()
+        print(gb.summary())
+
+        if not hasattr(self, 'outputFolder'):
+            return gb
+
+        rg = self.reportGenerator()
+        rg.addTitle(gb.title)
+        rg.addDoc(gb)
+        rg.addTable(gb.summary(tableFormat="html"))
+        rg.generateReport()
+
+        print("Report written to: " + self.outputFolder)
+        return gb
+
+    def studyOptions(self):
+        """Copy of the options analysing one file of the batch.
+
+        The list of files is left out as the copy is pickled for every task.
+        """
+        options = copy.copy(self)
+        options.batch = None
+        options.jobs = None
+        options.files = None
+        return options
+
+    def runBatch(self):
+        names = studyNames(self.files)
+        folders = [None] * len(self.files)
+        if hasattr(self, 'outputFolder'):
+            folders = [os.path.join(self.outputFolder, name) for name in names]
+            # Every report shares the assets written to the root.
+            self.assetFolder = self.outputFolder
+
+        options = [self.studyOptions()] * len(self.files)
+        if self.jobs is None:
+            rows = list(map(runStudy, options, self.files, folders))
+        else:
+            with ProcessPoolExecutor(self.jobs) as executor:
+                rows = list(executor.map(runStudy, options, self.files, folders))
+
+        headers = ['Study', 'File', '% GageRnR', 'Error']
+        print(tabulate(
+            [[name] + row for name, row in zip(names, rows)],
+            headers=headers))
+
+        if not hasattr(self, 'outputFolder'):
+            return rows
+
+        table = []
+        for name, row in zip(names, rows):
+            study = html.escape(name)
+            if not row[2]:
+                study = '<a href="' + html.escape(name) + '/index.html">' + study + '</a>'
+            table.append([study] + [html.escape(value) for value in row])
+        rg = self.reportGenerator()
+        rg.addTitle('Studies')
+        rg.addTable(tabulate(table, headers=headers, tablefmt="unsafehtml"))
+        rg.generateReport()
+
+        print("Index written to: " + self.outputFolder)
+        return rows
 
-        data *= self.scalar
+    def runServer(self):
+        server = GageRnR.Server(
+            host=self.host,
+            port=self.port,
+            socket=self.socket,
+            processes=self.jobs)
+        print("Serving on: " + str(server.address))
+        server.serveForever()
+
+    def run(self):
+        if self.serve:
+            return self.runServer()
+        if self.batch is not None:
+            return self.runBatch()
+        if self.wide:
+            return self.runWide()
+        if self.groupBy is not None:
+            return self.runGroups()
+
+        data = GageRnR.Dataset(self.load())
+        inMemory = not hasattr(self, 'memoryLimit')
 
         g = GageRnR.GageRnR(data)
         g.calculate()
@@ -104,17 +414,18 @@ class Application():
         s = GageRnR.Statistics(data)
         s.calculate()
 
-        n = GageRnR.Normality(data)
-        n.calculate()
+        if inMemory:
+            n = GageRnR.Normality(data)
+            n.calculate()
 
-        if hasattr(self, 'gt'):
+        if inMemory and hasattr(self, 'gt'):
             lin = GageRnR.Linearity(data=data, partGt=self.gt)
             lin.calculate()
 
         if not hasattr(self, 'outputFolder'):
-            return
+            return g
 
-        rg = ReportGenerator(self.outputFolder)
+        rg = self.reportGenerator()
 
         rg.addTitle(g.title)
         rg.addDoc(g)
@@ -123,14 +434,16 @@ class Application():
         rg.addTitle(s.title)
         rg.addDoc(s)
         rg.addTable(s.summary(tableFormat="html"))
-        rg.addPlot(s.createPartsBoxPlot(), 'Parts Box Plot')
-        rg.addPlot(s.createOperatorsBoxPlot(), 'Operators Box Plot')
 
-        rg.addTitle(n.title)
-        rg.addDoc(n)
-        rg.addTable(n.summary(tableFormat="html"))
+        if inMemory:
+            rg.addPlot(s.createPartsBoxPlot(), 'Parts Box Plot')
+            rg.addPlot(s.createOperatorsBoxPlot(), 'Operators Box Plot')
+
+            rg.addTitle(n.title)
+            rg.addDoc(n)
+            rg.addTable(n.summary(tableFormat="html"))
 
-        if hasattr(self, 'gt'):
+        if inMemory and hasattr(self, 'gt'):
             rg.addTitle(lin.title)
             rg.addDoc(lin)
             rg.addTable(lin.summary(tableFormat="html"))
@@ -139,3 +452,4 @@ class Application():
         rg.generateReport()
 
         print("Report written to: " + self.outputFolder)
+        return g
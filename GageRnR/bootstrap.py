@@ -0,0 +1,151 @@
+"""Module containing bootstrap confidence intervals for GageRnR."""
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .statistics import Statistics, Result, Component, ComponentNames
+from .cellStatistics import CellStatistics
+from .gageRnR import GageRnR
+
+# Upper bound on the number of cells resampled in one vectorized pass.
+BLOCK_SIZE = 2**20
+
+
+def calculateReplicates(cells, operatorIndex, partIndex):
+    """Calculate variance components for a batch of resamples.
+
+    :param CellStatistics cells: Cell statistics of the study.
+    :param numpy.array operatorIndex: Resampled operators [r, i].
+    :param numpy.array partIndex: Resampled parts [r, j].
+    """
+    index = (operatorIndex[:, :, np.newaxis], partIndex[:, np.newaxis, :])
+    g = GageRnR(CellStatistics(
+        cells.counts[index],
+        cells.means[index],
+        cells.m2[index]))
+    MS = g.calculateMS(g.calculateDoF(), g.calculateSS())
+    Var = g.calculateVar(MS)
+    return Var, g.calculatePercent(Var)
+
+
+class Bootstrap(Statistics):
+    """Bootstrap confidence intervals for the GageRnR variance components."""
+
+    title = "Bootstrap Confidence Intervals"
+
+    def __init__(
+            self,
+            data,
+            replicates=1000,
+            resample=(Component.PART,),
+            alpha=0.05,
+            seed=None,
+            processes=None):
+        """Initialize Bootstrap.
+
+        :param numpy.array data:
+            The data structured as n[i,j,k] where
+            i = operator, j = part, k = measurement.
+        :param int replicates: Number of bootstrap resamples.
+        :param resample:
+            The components to resample with replacement,
+            Component.OPERATOR and/or Component.PART.
+        :param float alpha: Intervals have 1 - alpha confidence.
+        :param seed: Seed of the random number generator.
+        :param int processes:
+            Number of worker processes, resamples are evaluated
+            in the calling process if None.
+        """
+        super().__init__(data)
+        self.replicates = replicates
+        self.resample = resample
+        self.alpha = alpha
+        self.seed = seed
+        self.processes = processes
+
+    def summary(self, tableFormat="fancy_grid", precision='.3f'):
+        """Convert result to tabular."""
+        if not hasattr(self, 'result'):
+            raise Exception(
+                'Bootstrap.calculate() should be run before calling summary()')
+
+        headers = ['Sources of Variance',
+                   'Var lower', 'Var upper',
+                   '% lower', '% upper']
+
+        names = dict(ComponentNames)
+        names[GageRnR.GRR] = GageRnR.GRR
+
+        table = []
+        for key in list(Component) + [GageRnR.GRR]:
+            row = [names[key]]
+            for result in [Result.Var, Result.Percent]:
+                for value in self.result[result][key]:
+                    row.append(format(value, precision))
+            table.append(row)
+
+        from tabulate import tabulate
+        return tabulate(
+            table,
+            headers=headers,
+            tablefmt=tableFormat)
+
+    def calculate(self):
+        """Calculate Bootstrap confidence intervals."""
+        samples = self.calculateSamples()
+
+        quantiles = [50 * self.alpha, 100 - 50 * self.alpha]
+        self.result = dict()
+        for result in samples:
+            self.result[result] = dict()
+            for key in samples[result]:
+                self.result[result][key] = np.nanpercentile(
+                    samples[result][key], quantiles)
+
+        return self.result
+
+    def createIndices(self):
+        """Create the resampled operator and part indices.
+
+        All resamples are drawn up front so that the result only
+        depends on the seed and not on the number of processes.
+        """
+        rng = np.random.default_rng(self.seed)
+        operatorIndex = np.broadcast_to(
+            np.arange(self.operators), (self.replicates, self.operators))
+        partIndex = np.broadcast_to(
+            np.arange(self.parts), (self.replicates, self.parts))
+
+        if Component.OPERATOR in self.resample:
+            operatorIndex = rng.integers(
+                self.operators, size=(self.replicates, self.operators))
+        if Component.PART in self.resample:
+            partIndex = rng.integers(
+                self.parts, size=(self.replicates, self.parts))
+
+        return operatorIndex, partIndex
+
+    def calculateSamples(self):
+        """Calculate the bootstrap distribution of Var and Percent."""
+        cells = self.dataset.cells()
+        operatorIndex, partIndex = self.createIndices()
+
+        step = max(1, BLOCK_SIZE // (self.operators * self.parts))
+        if self.processes is not None:
+            step = min(step, -(-self.replicates // self.processes))
+        chunks = [
+            (cells, operatorIndex[i:i + step], partIndex[i:i + step])
+            for i in range(0, self.replicates, step)]
+
+        if self.processes is None:
+            replicates = [calculateReplicates(*chunk) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(self.processes) as executor:
+                replicates = list(executor.map(
+                    calculateReplicates, *zip(*chunks)))
+
+        samples = dict()
+        for i, result in enumerate([Result.Var, Result.Percent]):
+            samples[result] = dict()
+            for key in replicates[0][i]:
+                samples[result][key] = np.concatenate(
+                    [replicate[i][key] for replicate in replicates])
+        return samples
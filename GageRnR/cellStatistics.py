@@ -0,0 +1,252 @@
+"""Module containing per cell sufficient statistics for GageRnR."""
+import numpy as np
+from .enums import Component
+
+# Upper bound on the number of elements in temporaries created
+# while reducing the data to cell statistics.
+BLOCK_SIZE = 2**16
+
+
+def combine(countsA, meansA, m2A, countsB, meansB, m2B):
+    """Combine two sets of cell statistics.
+
+    Uses the pairwise update of Chan et al. which stays numerically
+    stable when the cell means are large compared to their spread.
+    """
+    counts = countsA + countsB
+    delta = meansB - meansA
+    weight = np.divide(
+        countsB, counts,
+        out=np.zeros(np.shape(counts)),
+        where=counts > 0)
+    means = meansA + delta * weight
+    m2 = m2A + m2B + delta**2 * countsA * weight
+    return counts, means, m2
+
+
+class CellStatistics(object):
+    """Count, mean and centered sum of squares per operator and part.
+
+    Every Gauge R&R sum of squares can be derived from these statistics,
+    which are only operators * parts large instead of the size of the data.
+    """
+
+    def __init__(self, counts, means, m2):
+        """Initialize CellStatistics.
+
+        :param numpy.array counts:
+            Number of measurements in every cell, shaped [..., i, j]
+            where i = operator, j = part.
+        :param numpy.array means:
+            Mean of the measurements in every cell.
+        :param numpy.array m2:
+            Sum of squared deviations from the cell mean in every cell.
+        """
+        self.counts = counts
+        self.means = means
+        self.m2 = m2
+        self.operators = counts.shape[-2]
+        self.parts = counts.shape[-1]
+        self.batch = counts.shape[:-2]
+
+    @property
+    def shape(self):
+        """Shape of the data the statistics describe.
+
+        The number of measurements is the largest cell count which for
+        a balanced study equals the number of measurements per cell.
+        """
+        measurements = int(np.max(self.counts)) if self.counts.size else 0
+        return self.batch + (self.operators, self.parts, measurements)
+
+    @classmethod
+    def zeros(cls, operators, parts):
+        """Create empty statistics that readings can be added to."""
+        shape = (operators, parts)
+        return cls(
+            np.zeros(shape, dtype=int),
+            np.zeros(shape),
+            np.zeros(shape))
+
+    @classmethod
+    def fromData(cls, data, blockSize=BLOCK_SIZE):
+        """Reduce data to cell statistics.
+
+        The data is visited in blocks of parts so that no temporary
+        larger than blockSize elements is created. Missing measurements
+        marked as NaN are left out of the statistics of their cell.
+        The statistics are always double precision, whatever the
+        precision of the data.
+
+        :param numpy.array data:
+            Data structured as n[..., i, j, k] where i = operator,
+            j = part, k = measurement.
+        """
+        counts = np.empty(data.shape[:-1], dtype=int)
+        means = np.empty(data.shape[:-1])
+        m2 = np.empty(data.shape[:-1])
+        inexact = np.issubdtype(data.dtype, np.inexact)
+
+        partSize = data.size // max(1, data.shape[-2])
+        step = max(1, blockSize // max(1, partSize))
+        for start in range(0, data.shape[-2], step):
+            cells = np.s_[..., start:start + step]
+            # Blocks of single precision data are accumulated in double.
+            block = np.asarray(data[cells + (slice(None),)], dtype=np.float64)
+            missing = np.isnan(block) if inexact else None
+            if missing is not None and missing.any():
+                counts[cells] = block.shape[-1] - np.sum(missing, axis=-1)
+                block = np.where(missing, 0, block)
+                means[cells] = np.divide(
+                    np.sum(block, axis=-1), counts[cells],
+                    out=np.zeros(counts[cells].shape),
+                    where=counts[cells] > 0)
+                deviation = np.where(
+                    missing, 0, block - means[cells + (np.newaxis,)])
+            else:
+                counts[cells] = block.shape[-1]
+                means[cells] = np.mean(block, axis=-1)
+                deviation = block - means[cells + (np.newaxis,)]
+            m2[cells] = np.einsum('...k,...k->...', deviation, deviation)
+
+        return cls(counts, means, m2)
+
+    def add(self, operator, part, value):
+        """Add readings to the statistics.
+
+        Accepts a single reading or equally long arrays of readings,
+        the statistics are updated in place without storing the values.
+        A single reading updates its cell with the update of Welford in
+        constant time, arrays of readings are reduced per cell first.
+
+        :param operator: Operator index of each reading.
+        :param part: Part index of each reading.
+        :param value: Measured value of each reading.
+        """
+        if np.ndim(operator) == 0 and np.ndim(part) == 0 and np.ndim(value) == 0:
+            return self.addReading(operator, part, value)
+
+        operator = np.ravel(operator)
+        part = np.ravel(part)
+        value = np.ravel(value).astype(float)
+        size = self.operators * self.parts
+        index = np.ravel_multi_index((operator, part), (self.operators, self.parts))
+
+        counts = np.bincount(index, minlength=size)
+        sums = np.bincount(index, weights=value, minlength=size)
+        means = np.divide(
+            sums, counts,
+            out=np.zeros(size),
+            where=counts > 0)
+        m2 = np.bincount(
+            index, weights=(value - means[index])**2, minlength=size)
+
+        shape = (self.operators, self.parts)
+        self.counts, self.means, self.m2 = combine(
+            self.counts, self.means, self.m2,
+            counts.reshape(shape), means.reshape(shape), m2.reshape(shape))
+        return self
+
+    def addReading(self, operator, part, value):
+        """Add a single reading to its cell in place."""
+        # Raises ValueError for indices out of bounds, as for arrays.
+        index = np.ravel_multi_index((operator, part), (self.operators, self.parts))
+        cell = divmod(int(index), self.parts)
+        count = self.counts[cell] + 1
+        delta = float(value) - self.means[cell]
+        self.means[cell] += delta / count
+        self.m2[cell] += delta * (float(value) - self.means[cell])
+        self.counts[cell] = count
+        return self
+
+    def merge(self, other):
+        """Merge with statistics from another shard of the same study.
+
+        Merging is associative and commutative so shards can be reduced
+        in any order, the merged statistics describe the union of the
+        readings of both shards.
+        """
+        if self.counts.shape != other.counts.shape:
+            raise AttributeError(
+                "Can not merge cell statistics with different shapes.")
+        return CellStatistics(*combine(
+            self.counts, self.means, self.m2,
+            other.counts, other.means, other.m2))
+
+    def __add__(self, other):
+        return self.merge(other)
+
+    def calculateMean(self):
+        """Calculate Mean."""
+        total = self.counts * self.means
+        mu = np.sum(total, axis=(-2, -1)) / np.sum(self.counts, axis=(-2, -1))
+        omu = np.sum(total, axis=-1) / np.sum(self.counts, axis=-1)
+        pmu = np.sum(total, axis=-2) / np.sum(self.counts, axis=-2)
+        emu = self.means.reshape(self.batch + (self.operators * self.parts,))
+        return {
+            Component.TOTAL: mu[..., np.newaxis],
+            Component.OPERATOR: omu,
+            Component.PART: pmu,
+            Component.MEASUREMENT: emu}
+
+    def calculateStd(self):
+        """Calculate Std of all, per operator and per part measurements."""
+        mean = self.calculateMean()
+        mu = mean[Component.TOTAL]
+
+        def std(axis, mean):
+            counts = np.sum(self.counts, axis=axis)
+            m2 = np.sum(
+                self.m2 + self.counts * (self.means - mean)**2,
+                axis=axis)
+            return np.sqrt(m2 / (counts - 1))
+
+        return {
+            Component.TOTAL: std((-2, -1), mu[..., np.newaxis])[..., np.newaxis],
+            Component.OPERATOR: std(-1, mean[Component.OPERATOR][..., np.newaxis]),
+            Component.PART: std(-2, mean[Component.PART][..., np.newaxis, :])}
+
+    def scale(self, scalar):
+        """Statistics of the readings multiplied by a scalar."""
+        return CellStatistics(
+            self.counts,
+            self.means * scalar,
+            self.m2 * scalar**2)
+
+    def effectiveCount(self):
+        """Harmonic mean of the cell counts.
+
+        Equals the number of measurements per cell for a balanced study.
+        """
+        return self.operators * self.parts / np.sum(1 / self.counts, axis=(-2, -1))
+
+    def calculateSS(self):
+        """Calculate Sum of Squares.
+
+        Unbalanced studies are analysed with the unweighted means method,
+        the cell means are weighted by the harmonic mean of the cell counts.
+        For balanced studies this is the ordinary two-way ANOVA.
+        """
+        if np.any(self.counts == 0):
+            raise AttributeError(
+                "Every operator and part needs at least one measurement.")
+
+        count = self.effectiveCount()
+        mu = np.mean(self.means, axis=(-2, -1))[..., np.newaxis, np.newaxis]
+        omu = np.mean(self.means, axis=-1)[..., np.newaxis]
+        pmu = np.mean(self.means, axis=-2)[..., np.newaxis, :]
+
+        SS = dict()
+        SS[Component.MEASUREMENT] = np.sum(self.m2, axis=(-2, -1))
+        SS[Component.OPERATOR] = count * self.parts * np.sum(
+            (omu - mu)**2, axis=(-2, -1))
+        SS[Component.PART] = count * self.operators * np.sum(
+            (pmu - mu)**2, axis=(-2, -1))
+        SS[Component.OPERATOR_BY_PART] = count * np.sum(
+            (self.means - omu - pmu + mu)**2, axis=(-2, -1))
+        SS[Component.TOTAL] = \
+            SS[Component.OPERATOR] + \
+            SS[Component.PART] + \
+            SS[Component.OPERATOR_BY_PART] + \
+            SS[Component.MEASUREMENT]
+        return SS
@@ -0,0 +1,112 @@
+"""Module containing closed form confidence intervals of variance components.
+
+A variance component is estimated as a linear combination of mean squares
+gamma = sum(c_q * MS_q), the intervals are calculated from the mean squares
+and their degrees of freedom only, see Burdick and Graybill,
+Confidence Intervals on Variance Components, 1992.
+"""
+import numpy as np
+
+
+def upperF(alpha, dfn, dfd=None):
+    """Upper alpha quantile of the F distribution, dfd=None means infinite."""
+    import scipy.stats as stats
+    if dfd is None:
+        return stats.chi2.isf(alpha, dfn) / dfn
+    return stats.f.isf(alpha, dfn, dfd)
+
+
+def lowerF(alpha, dfn, dfd=None):
+    """Lower alpha quantile of the F distribution, dfd=None means infinite."""
+    import scipy.stats as stats
+    if dfd is None:
+        return stats.chi2.ppf(alpha, dfn) / dfn
+    return stats.f.ppf(alpha, dfn, dfd)
+
+
+def estimate(coefficients, MS):
+    """Estimate of the linear combination of mean squares."""
+    return sum(c * MS[key] for key, c in coefficients.items())
+
+
+def mlsInterval(coefficients, MS, DoF, alpha=0.05):
+    """Modified large sample interval.
+
+    Uses the Ting et al. (1990) form of the MLS interval which handles
+    any number of positive coefficients and a single negative one.
+
+    :param dict coefficients:
+        Coefficient c_q of every mean square, the sign of a
+        coefficient has to be the same for all studies.
+    :param dict MS: Mean squares, scalars or arrays of studies.
+    :param dict DoF: Degrees of freedom of the mean squares.
+    :param float alpha: The interval has 1 - alpha confidence.
+    """
+    a = alpha / 2
+    positive = [key for key, c in coefficients.items() if np.all(c > 0)]
+    negative = [key for key, c in coefficients.items() if np.all(c < 0)]
+    if len(negative) > 1:
+        raise AttributeError("MLS supports at most one negative coefficient.")
+
+    G = dict()
+    H = dict()
+    for key in positive + negative:
+        G[key] = 1 - 1 / upperF(a, DoF[key])
+        H[key] = 1 / lowerF(a, DoF[key]) - 1
+
+    term = dict()
+    for key in positive + negative:
+        term[key] = abs(coefficients[key]) * MS[key]
+
+    lower = 0
+    upper = 0
+    for q in positive:
+        lower = lower + (G[q] * term[q])**2
+        upper = upper + (H[q] * term[q])**2
+        for r in negative:
+            F = upperF(a, DoF[q], DoF[r])
+            Gqr = ((F - 1)**2 - G[q]**2 * F**2 - H[r]**2) / F
+            F = lowerF(a, DoF[q], DoF[r])
+            Hqr = ((1 - F)**2 - H[q]**2 * F**2 - G[r]**2) / F
+            lower = lower + Gqr * term[q] * term[r]
+            upper = upper + Hqr * term[q] * term[r]
+
+    for i, q in enumerate(positive):
+        for t in positive[i + 1:]:
+            n = DoF[q] + DoF[t]
+            Gqt = 1 - 1 / upperF(a, n)
+            Gqt = (
+                Gqt**2 * n**2 / (DoF[q] * DoF[t]) -
+                G[q]**2 * DoF[q] / DoF[t] -
+                G[t]**2 * DoF[t] / DoF[q]) / (len(positive) - 1)
+            lower = lower + Gqt * term[q] * term[t]
+
+    for r in negative:
+        lower = lower + (H[r] * term[r])**2
+        upper = upper + (G[r] * term[r])**2
+
+    gamma = estimate(coefficients, MS)
+    return np.stack([
+        np.maximum(gamma - np.sqrt(lower), 0),
+        np.maximum(gamma + np.sqrt(upper), 0)], axis=-1)
+
+
+def satterthwaiteInterval(coefficients, MS, DoF, alpha=0.05):
+    """Satterthwaite interval.
+
+    The estimate is approximated by a scaled chi-square distribution
+    with nu = gamma^2 / sum((c_q * MS_q)^2 / n_q) degrees of freedom.
+    Estimates that are not positive give the interval [0, 0].
+    """
+    import scipy.stats as stats
+
+    gamma = np.maximum(estimate(coefficients, MS), 0)
+    denominator = sum(
+        (c * MS[key])**2 / DoF[key] for key, c in coefficients.items())
+    nu = gamma**2 / denominator
+    valid = gamma > 0
+    nu = np.where(valid, nu, 1)
+    with np.errstate(divide='ignore', over='ignore'):
+        return np.stack([
+            np.where(valid, nu * gamma / stats.chi2.isf(alpha / 2, nu), 0),
+            np.where(valid, nu * gamma / stats.chi2.ppf(alpha / 2, nu), 0)], axis=-1)
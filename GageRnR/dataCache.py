@@ -0,0 +1,118 @@
+"""Module containing a binary cache of parsed data files."""
+import hashlib
+import json
+import os
+import numpy as np
+
+# Default upper bound on the size of a cache folder, in bytes.
+CACHE_SIZE = 1024 * 2**20
+
+
+def fileSize(path):
+    """Size of a file in bytes, 0 if it has been removed."""
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return 0
+
+
+class DataCache(object):
+    """Parsed data stored as .npy files in a cache folder.
+
+    Entries are keyed on the path, size and modification time of the
+    data file together with the options it was loaded with, so editing
+    the file or changing an option misses the cache. Entries are memory
+    mapped when read and the least recently used are evicted once the
+    folder grows beyond maxBytes.
+    """
+
+    def __init__(self, folder, maxBytes=CACHE_SIZE):
+        """Initialize DataCache.
+
+        :param str folder: Folder the entries are stored in.
+        :param int maxBytes: Upper bound on the size of the folder.
+        """
+        self.folder = folder
+        self.maxBytes = maxBytes
+
+    def key(self, file, options):
+        """Key of a file loaded with options."""
+        stat = os.stat(file)
+        description = json.dumps([
+            os.path.abspath(file),
+            stat.st_size,
+            stat.st_mtime_ns,
+            options], sort_keys=True)
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.folder, key + '.npy')
+
+    def get(self, file, options):
+        """Cached data of a file, None if it is not cached."""
+        path = self.path(self.key(file, options))
+        try:
+            # The modification time of an entry records its last use.
+            os.utime(path)
+            return np.load(path, mmap_mode='r')
+        except FileNotFoundError:
+            # Not cached, or evicted by another process.
+            return None
+
+    def put(self, file, options, data):
+        """Store data of a file and evict the least recently used entries."""
+        os.makedirs(self.folder, exist_ok=True)
+        path = self.path(self.key(file, options))
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as f:
+            np.save(f, np.asarray(data))
+        os.replace(temporary, path)
+        self.evict(keep=path)
+
+    def load(self, file, options, load):
+        """Cached data of a file, calling load() and caching it on a miss."""
+        data = self.get(file, options)
+        if data is None:
+            data = load()
+            self.put(file, options, data)
+        return data
+
+    def entries(self):
+        """Entries of the cache folder, least recently used first.
+
+        Entries removed by another process while listed are skipped.
+        """
+        try:
+            names = os.listdir(self.folder)
+        except FileNotFoundError:
+            return []
+        used = []
+        for name in names:
+            if not name.endswith('.npy'):
+                continue
+            path = os.path.join(self.folder, name)
+            try:
+                used.append((os.path.getmtime(path), path))
+            except FileNotFoundError:
+                continue
+        return [path for _, path in sorted(used)]
+
+    def size(self):
+        """Size of all entries in bytes."""
+        return sum(fileSize(path) for path in self.entries())
+
+    def evict(self, keep=None):
+        """Remove the least recently used entries until within maxBytes."""
+        entries = self.entries()
+        size = sum(fileSize(path) for path in entries)
+        for path in entries:
+            if size <= self.maxBytes:
+                break
+            if path == keep:
+                continue
+            size -= fileSize(path)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Evicted by another process.
+                continue
@@ -1,5 +1,166 @@
-
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import importlib.util
+import io
+import itertools
+import os.path
+import warnings
 import numpy as np
+from .cellStatistics import CellStatistics
+
+# Default memory ceiling used when loading out-of-core, in bytes.
+MEMORY_LIMIT = 64 * 2**20
+
+# Extensions of files that are memory mapped instead of parsed as text.
+BinaryExtensions = ['.npy', '.raw', '.bin']
+
+# Size of the blocks of text read and parsed at once, in bytes.
+BLOCK_BYTES = 16 * 2**20
+
+
+def readBlocks(f, blockBytes=BLOCK_BYTES):
+    """Read a file opened in binary mode in blocks of whole lines."""
+    rest = b''
+    for block in iter(lambda: f.read(blockBytes), b''):
+        block = rest + block
+        end = block.rfind(b'\n') + 1
+        rest = block[end:]
+        if end > 0:
+            yield block[:end]
+    if rest.strip():
+        yield rest
+
+
+def parsePandas(block, delimiter, dtype=np.float64):
+    """Parse a block of text with the C tokenizer of pandas.
+
+    Values are parsed round trip so they are identical to np.loadtxt.
+    Blocks the tokenizer rejects, such as rows with missing or empty fields
+    or literal nan values, are parsed again by parseNumpy so malformed
+    files raise the ValueError of np.loadtxt.
+
+    :returns: Matrix with one row per line of the block.
+    """
+    import pandas
+    try:
+        frame = pandas.read_csv(
+            io.BytesIO(block),
+            sep=delimiter,
+            header=None,
+            dtype=dtype,
+            comment='#',
+            na_filter=False,
+            float_precision='round_trip',
+            engine='c')
+    except pandas.errors.EmptyDataError:
+        return np.empty((0, 0), dtype=dtype)
+    except ValueError:
+        return parseNumpy(block, delimiter, dtype)
+    return frame.to_numpy(dtype=dtype)
+
+
+def parseNumpy(block, delimiter, dtype=np.float64):
+    """Parse a block of text with np.loadtxt.
+
+    :returns: Matrix with one row per line of the block.
+    """
+    with warnings.catch_warnings():
+        # Blocks holding only comments or blank lines are empty.
+        warnings.simplefilter("ignore", UserWarning)
+        values = np.loadtxt(
+            block.splitlines(), delimiter=delimiter, ndmin=2, dtype=dtype)
+    if values.size == 0:
+        return np.empty((0, 0), dtype=dtype)
+    return values
+
+
+Parsers = {
+    'pandas': parsePandas,
+    'numpy': parseNumpy}
+
+
+def sortLabels(labels):
+    """Labels sorted numerically when all of them are numbers, as text otherwise."""
+    try:
+        return sorted(labels, key=float)
+    except ValueError:
+        return sorted(labels)
+
+
+def factorize(labels, sort=False):
+    """Codes of labels numbered in order of first appearance or sorted.
+
+    Sorted labels are ordered as sortLabels, so replicates 1 to 10 are
+    numbered 1, 2, ..., 10 and not 1, 10, 2, ... as text. Uses the hash
+    table of pandas when it is installed, np.unique otherwise.
+
+    :returns: The distinct labels and the code of every label.
+    """
+    if importlib.util.find_spec('pandas'):
+        import pandas
+        codes, unique = pandas.factorize(labels)
+        unique = np.asarray(unique)
+    else:
+        unique, first, inverse = np.unique(
+            np.asarray(labels).astype(str), return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
+        unique, codes = unique[order], rank[inverse.ravel()]
+    if not sort:
+        return unique, codes
+
+    position = {label: i for i, label in enumerate(sortLabels(unique))}
+    rank = np.array([position[label] for label in unique], dtype=int)
+    return unique[np.argsort(rank)], rank[codes]
+
+
+def rankInGroup(groups):
+    """Position of every element among the elements of its group in order."""
+    order = np.argsort(groups, kind='stable')
+    sortedGroups = groups[order]
+    first = np.searchsorted(sortedGroups, sortedGroups, side='left')
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size) - first
+    return rank
+
+
+def readColumnsPandas(file, delimiter, labels, values, skiprows, dtype):
+    import pandas
+    frame = pandas.read_csv(
+        file,
+        sep=delimiter,
+        header=None,
+        skiprows=skiprows,
+        usecols=sorted(set(c for c in list(labels) + list(values) if c is not None)),
+        dtype=dict(
+            [(c, str) for c in labels if c is not None] +
+            [(c, dtype) for c in values]),
+        comment='#',
+        float_precision='round_trip',
+        engine='c')
+    return (
+        [None if c is None else frame[c].to_numpy() for c in labels],
+        frame[list(values)].to_numpy(dtype=dtype))
+
+
+def readColumnsNumpy(file, delimiter, labels, values, skiprows, dtype):
+    text = np.loadtxt(
+        file,
+        delimiter=delimiter,
+        skiprows=skiprows,
+        dtype=str,
+        ndmin=2)
+    text = np.char.strip(text)
+    value = text[:, list(values)]
+    return (
+        [None if c is None else text[:, c] for c in labels],
+        np.where(value == '', 'nan', value).astype(dtype))
+
+
+ColumnReaders = {
+    'pandas': readColumnsPandas,
+    'numpy': readColumnsNumpy}
 
 
 class DataLoader():
@@ -8,12 +169,303 @@ class DataLoader():
              file,
              structure,
              axes,
-             delimiter):
-        data = np.loadtxt(fname=file, delimiter=delimiter)
+             delimiter,
+             dtype=np.float64,
+             engine=None,
+             threads=None):
+        """Load a file into an array n[i,j,k] where i = operator, j = part, k = measurement.
+
+        Text files are read with parse, see there for engine and threads.
+
+        Binary .npy and raw files are memory mapped read only, the axes
+        are then applied as a strided view of the file so only the pages
+        that are used get read. When the transposed shape differs from
+        the structure the final reshape has to copy the data.
+
+        :param dtype:
+            Floating point type of the loaded data, np.float32 halves
+            the memory used while the analyses still accumulate in float64.
+            Data in .npy files keeps its stored type.
+        """
         s = (structure[axes[0]],
              structure[axes[1]],
              structure[axes[2]])
+        if self.isBinary(file):
+            data = self.loadBinary(file, s, dtype)
+        else:
+            data = self.parse(file, delimiter, dtype, engine, threads)
         data = data.reshape(s)
         data = np.transpose(data, axes=axes)
         data = data.reshape(tuple(structure))
         return data
+
+    def parse(self,
+              file,
+              delimiter,
+              dtype=np.float64,
+              engine=None,
+              threads=None,
+              blockBytes=BLOCK_BYTES):
+        """Parse a delimited text file into a flat array.
+
+        The file is read in large blocks of whole lines which are parsed
+        independently, optionally on a pool of threads. As np.loadtxt,
+        every row must hold the same number of values and ValueError is
+        raised on missing, empty or malformed fields.
+
+        :param str engine:
+            'pandas' uses the C tokenizer of pandas, 'numpy' uses
+            np.loadtxt. Defaults to numpy, parsing round trip makes
+            pandas slower than np.loadtxt on blocks of numbers.
+        :param int threads:
+            Number of threads parsing blocks, blocks are parsed in the
+            calling thread if None.
+        :param int blockBytes: Size of the blocks in bytes.
+        """
+        if engine is None:
+            engine = 'numpy'
+        if engine not in Parsers:
+            raise AttributeError("Engine can only be one of " + str(list(Parsers)))
+        parser = functools.partial(Parsers[engine], delimiter=delimiter, dtype=dtype)
+
+        with open(file, 'rb') as f:
+            blocks = readBlocks(f, blockBytes)
+            if threads is None:
+                values = [parser(block) for block in blocks]
+            else:
+                with ThreadPoolExecutor(threads) as executor:
+                    values = list(executor.map(parser, blocks))
+        values = [value for value in values if value.size]
+        if not values:
+            return np.empty(0, dtype=dtype)
+        columns = values[0].shape[1]
+        for value in values:
+            if value.shape[1] != columns:
+                raise ValueError(
+                    "The number of columns changed from %d to %d." % (columns, value.shape[1]))
+        return np.concatenate([value.ravel() for value in values])
+
+    def loadTidy(self,
+                 file,
+                 delimiter=',',
+                 columns=(0, 1, 2, 3),
+                 skiprows=0,
+                 dtype=np.float64,
+                 engine=None):
+        """Load a file with one measurement per row in any order.
+
+        Operators and parts are factorized in order of first appearance
+        and the values scattered into an array n[i,j,k] where
+        i = operator, j = part, k = measurement. Measurements a cell
+        lacks are NaN.
+
+        :param tuple columns:
+            Index of the operator, part, replicate and value columns.
+            Replicate can be None, the measurements of a cell are then
+            numbered in the order they appear.
+        :param int skiprows: Number of header lines to skip.
+        :param str engine:
+            'pandas' or 'numpy', defaults to pandas when it is installed.
+        :returns:
+            The data and its labels as expected by Statistics,
+            {'Operator': [...], 'Part': [...]}.
+        """
+        (operator, part, replicate), value = self.readColumns(
+            file, delimiter, columns[:3], columns[3:], skiprows, dtype, engine)
+        data, labels = self.scatter(operator, part, replicate, value, dtype)
+        return data[0], labels
+
+    def loadWide(self,
+                 file,
+                 delimiter=',',
+                 columns=(0, 1, 2),
+                 characteristics=None,
+                 dtype=np.float64,
+                 engine=None):
+        """Load a file with many characteristics measured per row.
+
+        The first line names the columns, every row holds the operator,
+        part and replicate followed by one value per characteristic. All
+        characteristics are read in one pass into an array n[c,i,j,k]
+        where c = characteristic, i = operator, j = part, k = measurement,
+        which GageRnR analyses as a batch.
+
+        :param tuple columns:
+            Index of the operator, part and replicate columns, see loadTidy.
+        :param list characteristics:
+            Names or indices of the characteristic columns,
+            defaults to all other columns.
+        :returns:
+            The data and its labels as expected by Statistics, the
+            names of the characteristics are stored under 'Characteristic'.
+        """
+        header = self.header(file, delimiter)
+        if characteristics is None:
+            characteristics = [i for i in range(len(header)) if i not in columns]
+        characteristics = [
+            c if isinstance(c, int) else header.index(c) for c in characteristics]
+
+        (operator, part, replicate), value = self.readColumns(
+            file, delimiter, columns, characteristics, 1, dtype, engine)
+        data, labels = self.scatter(operator, part, replicate, value, dtype)
+        labels['Characteristic'] = [header[c] for c in characteristics]
+        return data, labels
+
+    def loadGroups(self,
+                   file,
+                   delimiter=',',
+                   key=0,
+                   columns=(1, 2, 3, 4),
+                   skiprows=0,
+                   dtype=np.float64,
+                   engine=None):
+        """Load a tidy file holding the measurements of several groups.
+
+        The rows are indexed by the key column once and the rows of every
+        group scattered as in loadTidy.
+
+        :param int key: Index of the column holding the group of a row.
+        :param tuple columns:
+            Index of the operator, part, replicate and value columns,
+            see loadTidy.
+        :returns:
+            Dict from group key to the data and labels of the group,
+            in order of first appearance.
+        """
+        text, value = self.readColumns(
+            file, delimiter, (key,) + tuple(columns[:3]), columns[3:], skiprows, dtype, engine)
+        keys, codes = factorize(text[0])
+        order = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[order], np.arange(len(keys) + 1))
+
+        groups = dict()
+        for i, group in enumerate(keys):
+            rows = order[bounds[i]:bounds[i + 1]]
+            data, labels = self.scatter(
+                *[None if column is None else column[rows] for column in text[1:]],
+                value[rows], dtype)
+            groups[str(group)] = (data[0], labels)
+        return groups
+
+    def header(self, file, delimiter=','):
+        """Names of the columns in the first line of a file."""
+        with open(file) as f:
+            return [name.strip() for name in f.readline().split(delimiter)]
+
+    def readColumns(self, file, delimiter, labels, values, skiprows, dtype, engine=None):
+        """Read label columns as text and value columns as a matrix of dtype."""
+        if engine is None:
+            engine = 'pandas' if importlib.util.find_spec('pandas') else 'numpy'
+        if engine not in ColumnReaders:
+            raise AttributeError("Engine can only be one of " + str(list(ColumnReaders)))
+        return ColumnReaders[engine](file, delimiter, labels, values, skiprows, dtype)
+
+    def scatter(self, operator, part, replicate, value, dtype=np.float64):
+        """Scatter rows of values into an array n[c,i,j,k].
+
+        :param value: Matrix with one row per measurement and one column per c.
+        """
+        operators, operator = factorize(operator)
+        parts, part = factorize(part)
+        cell = operator * len(parts) + part
+        if replicate is None:
+            replicate = rankInGroup(cell)
+        else:
+            _, replicate = factorize(replicate, sort=True)
+        measurements = int(np.max(replicate)) + 1 if replicate.size else 0
+
+        index = cell * measurements + replicate
+        shape = (len(operators), len(parts), measurements)
+        if index.size and np.max(np.bincount(index, minlength=int(np.prod(shape)))) > 1:
+            raise ValueError("The file holds several values of the same measurement.")
+        data = np.full((value.shape[1],) + shape, np.nan, dtype=dtype)
+        data.reshape(value.shape[1], -1)[:, index] = value.T
+        labels = {
+            'Operator': [str(label) for label in operators],
+            'Part': [str(label) for label in parts]}
+        return data, labels
+
+    def isBinary(self, file):
+        """True if the file is a .npy or raw binary file."""
+        return os.path.splitext(str(file))[1].lower() in BinaryExtensions
+
+    def loadBinary(self, file, shape, dtype=np.float64):
+        """Memory map a .npy or raw binary file read only.
+
+        :param tuple shape: Shape of the data as stored in the file.
+        :param dtype: Type of the values in a raw file.
+        """
+        if os.path.splitext(str(file))[1].lower() == '.npy':
+            data = np.load(file, mmap_mode='r')
+        else:
+            dtype = np.dtype(dtype)
+            size = os.path.getsize(file)
+            if size != int(np.prod(shape)) * dtype.itemsize:
+                raise ValueError(
+                    "Can not reshape %d bytes of %s into %s" %
+                    (size, dtype.name, shape))
+            data = np.memmap(file, dtype=dtype, mode='r', shape=shape)
+        if data.size != int(np.prod(shape)):
+            raise ValueError(
+                "Can not reshape %d values into %s" % (data.size, shape))
+        return data
+
+    def loadCells(self,
+                  file,
+                  structure,
+                  axes,
+                  delimiter,
+                  memoryLimit=MEMORY_LIMIT,
+                  dtype=np.float64):
+        """Load a file out-of-core into CellStatistics.
+
+        The file is read in chunks of rows sized to stay roughly within
+        memoryLimit bytes, every chunk is folded into the statistics and
+        then discarded so the whole data is never held in memory.
+        The structure, axes, delimiter and dtype have the same meaning as
+        in load, the chunks are parsed as dtype. Memory mapped binary
+        files are reduced in blocks directly.
+        """
+        if self.isBinary(file):
+            return CellStatistics.fromData(
+                self.load(file, structure, axes, delimiter, dtype))
+
+        s = tuple(structure[a] for a in axes)
+        transposed = tuple(s[a] for a in axes)
+        size = int(np.prod(structure))
+
+        cells = CellStatistics.zeros(structure[0], structure[1])
+        offset = 0
+        with open(file) as f:
+            rows = self.chunkRows(f, delimiter, memoryLimit)
+            for lines in iter(lambda: list(itertools.islice(f, rows)), []):
+                with warnings.catch_warnings():
+                    # Chunks holding only comments or blank lines are empty.
+                    warnings.simplefilter("ignore", UserWarning)
+                    values = np.loadtxt(
+                        lines, delimiter=delimiter, ndmin=1, dtype=dtype).ravel()
+                if offset + values.size > size:
+                    offset += values.size
+                    break
+                index = np.arange(offset, offset + values.size)
+                raw = np.unravel_index(index, s)
+                index = np.ravel_multi_index(
+                    tuple(raw[a] for a in axes), transposed)
+                operator, part, _ = np.unravel_index(index, tuple(structure))
+                cells.add(operator, part, values)
+                offset += values.size
+
+        if offset != size:
+            raise ValueError(
+                "Can not reshape %d or more values into structure %s" %
+                (offset, structure))
+        return cells
+
+    def chunkRows(self, f, delimiter, memoryLimit):
+        """Estimate how many rows of an open file fit in memoryLimit bytes."""
+        position = f.tell()
+        line = f.readline()
+        f.seek(position)
+        # The text, the parsed values and the index arrays derived from them.
+        rowBytes = 2 * len(line) + 64 * (line.count(delimiter) + 1)
+        return max(1, memoryLimit // rowBytes)
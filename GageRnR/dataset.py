@@ -0,0 +1,84 @@
+"""Module containing the dataset shared by the analyses."""
+import numpy as np
+from .enums import Component
+from .cellStatistics import CellStatistics
+
+
+class Dataset(object):
+    """Data of a study together with lazily computed, memoized marginals.
+
+    Passing the same Dataset to GageRnR, Statistics, Normality and
+    Linearity makes every marginal be computed once for all of them.
+    Reshaped views keep the dtype of the data, so float32 data halves
+    their memory while every statistic is still accumulated in float64.
+    """
+
+    def __init__(self, data):
+        """Initialize Dataset.
+
+        :param data:
+            A numpy array n[i,j,k] where i = operator, j = part,
+            k = measurement or CellStatistics reduced from such data.
+        """
+        self.data = data
+        self.cache = dict()
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    def memoize(self, name, calculate):
+        if name not in self.cache:
+            self.cache[name] = calculate()
+        return self.cache[name]
+
+    def isReduced(self):
+        """True if only the cell statistics of the data are available."""
+        return not isinstance(self.data, np.ndarray)
+
+    def isComplete(self):
+        """True if every cell holds all its measurements."""
+        return bool(np.all(self.cells().counts == self.shape[-1]))
+
+    def mean(self):
+        """Mean of all, per operator, per part and per cell measurements."""
+        if self.isReduced():
+            return self.data.calculateMean()
+        return self.memoize('mean', lambda: self.cells().calculateMean())
+
+    def std(self):
+        """Std of all, per operator and per part measurements.
+
+        Accumulated in double precision for single precision data.
+        Missing measurements are excluded using the cell statistics.
+        """
+        if self.isReduced():
+            return self.data.calculateStd()
+
+        def calculate():
+            if not self.isComplete():
+                return self.cells().calculateStd()
+            return {
+                Component.TOTAL: np.array([np.std(self.data, ddof=1, dtype=np.float64)]),
+                Component.OPERATOR: np.std(self.operators(), axis=1, ddof=1, dtype=np.float64),
+                Component.PART: np.std(self.parts(), axis=1, ddof=1, dtype=np.float64)}
+        return self.memoize('std', calculate)
+
+    def cells(self):
+        """Per cell counts, means and sum of squares."""
+        if self.isReduced():
+            return self.data
+        return self.memoize('cells', lambda: CellStatistics.fromData(self.data))
+
+    def parts(self):
+        """Data reshaped to [part, operator * measurement]."""
+        def calculate():
+            operators, parts, measurements = self.data.shape
+            data = np.transpose(self.data, axes=(1, 0, 2))
+            return data.reshape(parts, measurements * operators)
+        return self.memoize('parts', calculate)
+
+    def operators(self):
+        """Data reshaped to [operator, part * measurement]."""
+        operators, parts, measurements = self.data.shape
+        return self.data.reshape(operators, measurements * parts)
@@ -0,0 +1,37 @@
+"""Enums naming the components and results of the analyses."""
+from enum import Enum
+
+
+class Component(Enum):
+    """Enum containing the different Variance parts of GageRnR."""
+
+    OPERATOR = 0
+    PART = 1
+    OPERATOR_BY_PART = 2
+    MEASUREMENT = 3
+    TOTAL = 4
+
+
+ComponentNames = {
+    Component.OPERATOR: 'Operator',
+    Component.PART: 'Part',
+    Component.OPERATOR_BY_PART: 'Operator by Part',
+    Component.MEASUREMENT: 'Measurement',
+    Component.TOTAL: 'Total'}
+
+
+class Result(Enum):
+    """Enum containing the measurements calculated by GageRnR."""
+
+    DF = 0
+    Mean = 1
+    SS = 3
+    MS = 4
+    Var = 5
+    Std = 6
+    F = 7
+    P = 8
+    W = 9
+    K = 10
+    Bias = 11
+    Percent = 12
@@ -1,9 +1,8 @@
 """Module containing the algorithm for GageRnR."""
 import numpy as np
-import math
-import scipy.stats as stats
-from tabulate import tabulate
 from .statistics import Statistics, Result, Component, ComponentNames
+from .lazyResult import LazyResult
+from .confidence import mlsInterval, satterthwaiteInterval
 
 ResultNames = {
     Result.DF: 'DF',
@@ -21,21 +20,43 @@ class GageRnR(Statistics):
     GRR = 'GageRnR'
     title = "Gauge R&R"
 
-    def __init__(self, data):
+    def __init__(self, data, labels=None):
         """Initialize GageRnR algorithm.
 
         :param numpy.array data:
             The data tha we want to analyse using GageRnR.
             The input should be structured in a 3d array
-            n[i,j,k] where i = operator, j = part, k = measurement
+            n[i,j,k] where i = operator, j = part, k = measurement.
+            A stack of studies can be analysed in one pass by
+            passing a 4d array n[b,i,j,k] where b = study, every
+            result is then an array indexed by study.
+            CellStatistics can be passed instead of the raw data.
+            Missing measurements (NaN or unequal cell counts) are
+            analysed with the unweighted means method, every cell
+            needs at least one measurement.
+        :param dict labels: Names of the operators and parts.
         """
-        super().__init__(data)
+        super().__init__(data, labels)
 
-    def summary(self, tableFormat="fancy_grid", precision='.3f'):
-        """Convert result to tabular."""
+    def __str__(self):
+        """Summarize GageRnR, batched results are summarized per study."""
+        if self.batch and hasattr(self, 'result'):
+            return '\n'.join(
+                self.summary(study=i) for i in np.ndindex(self.batch))
+        return super().__str__()
+
+    def summary(self, tableFormat="fancy_grid", precision='.3f', study=None):
+        """Convert result to tabular.
+
+        :param study:
+            Index of the study to summarize when the data is batched.
+        """
         if not hasattr(self, 'result'):
             raise Exception(
                 'GageRnR.calculate() should be run before calling summary()')
+        if self.batch and study is None:
+            raise Exception(
+                'GageRnR.summary() requires a study index for batched data')
 
         headers = ['Sources of Variance']
 
@@ -47,70 +68,126 @@ class GageRnR(Statistics):
             innerTable = [ComponentNames[comp]]
             for key in ResultNames:
                 if comp in self.result[key]:
-                    innerTable.append(
-                        format(self.result[key][comp], precision))
+                    value = np.asarray(self.result[key][comp])
+                    if self.batch:
+                        value = value[study]
+                    innerTable.append(format(float(value), precision))
                 else:
                     innerTable.append('')
 
             table.append(innerTable)
 
+        from tabulate import tabulate
         return tabulate(
             table,
             headers=headers,
             tablefmt=tableFormat)
 
-    def calculate(self):
-        """Calculate GageRnR."""
-        self.result = dict()
-        self.result[Result.DF] = self.calculateDoF()
-        self.result[Result.Mean] = self.calculateMean()
-        self.result[Result.SS] = self.calculateSS()
+    def studySummary(self, names=None, tableFormat="fancy_grid", precision='.3f', header='Study'):
+        """Convert the result of every study to one row of a table.
 
-        self.result[Result.MS] = self.calculateMS(
-            self.result[Result.DF],
-            self.result[Result.SS])
-
-        self.result[Result.Var] = self.calculateVar(
-            self.result[Result.MS])
+        :param list names: Name of every study, defaults to its index.
+        :param str header: Header of the column of names.
+        """
+        if not hasattr(self, 'result'):
+            raise Exception(
+                'GageRnR.calculate() should be run before calling studySummary()')
+
+        keys = [
+            Component.OPERATOR,
+            Component.PART,
+            Component.OPERATOR_BY_PART,
+            Component.MEASUREMENT,
+            GageRnR.GRR]
+        headers = [header] + \
+            ['Var ' + ComponentNames.get(key, key) for key in keys] + \
+            ['% ' + GageRnR.GRR]
 
-        self.result[Result.Std] = self.calculateStd(self.result[Result.Var])
+        table = []
+        for i, study in enumerate(np.ndindex(self.batch)):
+            row = [str(i) if names is None else names[i]]
+            for value in [self.result[Result.Var][key] for key in keys] + \
+                    [self.result[Result.Percent][GageRnR.GRR]]:
+                row.append(format(float(np.asarray(value)[study]), precision))
+            table.append(row)
+
+        from tabulate import tabulate
+        return tabulate(
+            table,
+            headers=headers,
+            tablefmt=tableFormat)
 
-        self.result[Result.F] = self.calculateF(self.result[Result.MS])
+    def calculate(self):
+        """Calculate GageRnR.
 
-        self.result[Result.P] = self.calculateP(
-            self.result[Result.DF],
-            self.result[Result.F])
+        The result is computed lazily, every entry is calculated together
+        with the entries it depends on the first time it is accessed and
+        kept until the data is replaced.
+        """
+        self.result = LazyResult({
+            Result.DF: lambda result: self.calculateDoF(),
+            Result.Mean: lambda result: self.calculateMean(),
+            Result.SS: lambda result: self.calculateSS(self.calculateCells()),
+            Result.MS: lambda result: self.calculateMS(
+                result[Result.DF],
+                result[Result.SS]),
+            Result.Var: lambda result: self.calculateVar(result[Result.MS]),
+            Result.Std: lambda result: self.calculateStd(result[Result.Var]),
+            Result.F: lambda result: self.calculateF(result[Result.MS]),
+            Result.P: lambda result: self.calculateP(
+                result[Result.DF],
+                result[Result.F]),
+            Result.Percent: lambda result: self.calculatePercent(
+                result[Result.Var])})
 
         return self.result
 
     def calculateDoF(self):
-        """Calculate Degrees of freedom."""
+        """Calculate Degrees of freedom.
+
+        Missing measurements are left out of the measurement and total
+        degrees of freedom.
+        """
+        measurements = np.sum(self.calculateCells().counts, axis=(-2, -1))
         oDoF = self.operators - 1
         pDoF = self.parts - 1
         opDoF = (self.parts - 1) * (self.operators - 1)
-        eDof = self.parts * self.operators * (self.measurements - 1)
-        totDof = self.parts * self.operators * self.measurements - 1
-        return {
+        eDof = measurements - self.parts * self.operators
+        totDof = measurements - 1
+        DoF = {
             Component.OPERATOR: oDoF,
             Component.PART: pDoF,
             Component.OPERATOR_BY_PART: opDoF,
             Component.MEASUREMENT: eDof,
             Component.TOTAL: totDof}
+        if self.batch:
+            for key in DoF:
+                DoF[key] = np.broadcast_to(DoF[key], self.batch).copy()
+        return DoF
+
+    def calculateMeasurements(self):
+        """Calculate the number of measurements per cell.
+
+        For unbalanced studies this is the harmonic mean of the cell counts.
+        """
+        return self.calculateCells().effectiveCount()
+
+    def calculateCells(self):
+        """Calculate per cell counts, means and sum of squares."""
+        return self.dataset.cells()
 
     def calculateSquares(self):
         """Calculate Squares."""
         mean = self.calculateMean()
-        tS = (self.data - mean[Component.TOTAL])**2
-        oS = (mean[Component.OPERATOR] - mean[Component.TOTAL])**2
-        pS = (mean[Component.PART] - mean[Component.TOTAL])**2
+        mu = mean[Component.TOTAL]
+        tS = (self.data - mu[..., np.newaxis, np.newaxis])**2
+        oS = (mean[Component.OPERATOR] - mu)**2
+        pS = (mean[Component.PART] - mu)**2
 
-        dataE = self.data.reshape(
+        dataE = self.data.reshape(self.batch + (
             self.operators * self.parts,
-            self.measurements)
-        meanMeas = np.repeat(mean[Component.MEASUREMENT], self.measurements)
-        meanMeas = meanMeas.reshape(
-            self.operators * self.parts,
-            self.measurements)
+            self.measurements))
+        meanMeas = mean[Component.MEASUREMENT][..., np.newaxis]
 
         mS = (dataE - meanMeas)**2
         return {
@@ -124,11 +201,23 @@ class GageRnR(Statistics):
         squares = self.calculateSquares()
         SD = dict()
         for key in squares:
-            SD[key] = np.sum(squares[key])
+            SD[key] = np.sum(
+                squares[key].reshape(self.batch + (-1,)),
+                axis=-1)
         return SD
 
-    def calculateSS(self):
-        """Calculate Sum of Squares."""
+    def calculateSS(self, cells=None):
+        """Calculate Sum of Squares.
+
+        The sums are derived from cell statistics so that no
+        temporaries the size of the data are created.
+        """
+        if cells is None:
+            cells = self.calculateCells()
+        return cells.calculateSS()
+
+    def calculateSumOfSquares(self):
+        """Calculate Sum of Squares from the squared deviations."""
         SS = self.calculateSumOfDeviations()
 
         SS[Component.OPERATOR] = \
@@ -155,21 +244,21 @@ class GageRnR(Statistics):
     def calculateVar(self, MS):
         """Calculate GageRnR Variances."""
         Var = dict()
+        measurements = self.calculateMeasurements()
 
         Var[Component.MEASUREMENT] = MS[Component.MEASUREMENT]
         Var[Component.OPERATOR_BY_PART] = ((
             MS[Component.OPERATOR_BY_PART] - MS[Component.MEASUREMENT]) /
-            self.parts)
+            measurements)
         Var[Component.OPERATOR] = ((
             MS[Component.OPERATOR] - MS[Component.OPERATOR_BY_PART]) /
-            (self.parts * self.measurements))
+            (self.parts * measurements))
         Var[Component.PART] = ((
             MS[Component.PART] - MS[Component.OPERATOR_BY_PART]) /
-            (self.operators * self.measurements))
+            (self.operators * measurements))
 
         for key in Var:
-            if Var[key] < 0:
-                Var[key] = 0
+            Var[key] = np.maximum(Var[key], 0)
 
         Var[Component.TOTAL] = \
             Var[Component.OPERATOR] + \
@@ -188,10 +277,78 @@ class GageRnR(Statistics):
         """Calculate GageRnR Standard Deviations."""
         Std = dict()
         for key in Var:
-            Std[key] = math.sqrt(Var[key])
+            Std[key] = np.sqrt(Var[key])
 
         return Std
 
+    def calculateCoefficients(self):
+        """Calculate coefficients of the mean squares in every variance."""
+        o = self.operators
+        p = self.parts
+        m = self.calculateMeasurements()
+        return {
+            Component.MEASUREMENT: {
+                Component.MEASUREMENT: 1},
+            Component.OPERATOR_BY_PART: {
+                Component.OPERATOR_BY_PART: 1 / m,
+                Component.MEASUREMENT: -1 / m},
+            Component.OPERATOR: {
+                Component.OPERATOR: 1 / (p * m),
+                Component.OPERATOR_BY_PART: -1 / (p * m)},
+            Component.PART: {
+                Component.PART: 1 / (o * m),
+                Component.OPERATOR_BY_PART: -1 / (o * m)},
+            Component.TOTAL: {
+                Component.PART: 1 / (o * m),
+                Component.OPERATOR: 1 / (p * m),
+                Component.OPERATOR_BY_PART: (o * p - o - p) / (o * p * m),
+                Component.MEASUREMENT: (m - 1) / m},
+            GageRnR.GRR: {
+                Component.OPERATOR: 1 / (p * m),
+                Component.OPERATOR_BY_PART: (p - 1) / (p * m),
+                Component.MEASUREMENT: (m - 1) / m}}
+
+    def calculateConfidence(self, alpha=0.05, method='MLS'):
+        """Calculate confidence intervals of the variances.
+
+        The intervals are derived from the mean squares and degrees of
+        freedom in the result, for batched data an interval is calculated
+        for every study at once.
+
+        :param float alpha: The intervals have 1 - alpha confidence.
+        :param str method: 'MLS' (modified large sample) or 'Satterthwaite'.
+        :returns: Dict with the [lower, upper] interval of every variance.
+        """
+        if not hasattr(self, 'result'):
+            raise Exception(
+                'GageRnR.calculate() should be run before calling calculateConfidence()')
+
+        intervals = {
+            'MLS': mlsInterval,
+            'Satterthwaite': satterthwaiteInterval}
+        if method not in intervals:
+            raise AttributeError("Unknown confidence interval method: " + method)
+
+        CI = dict()
+        for key, coefficients in self.calculateCoefficients().items():
+            CI[key] = intervals[method](
+                coefficients,
+                self.result[Result.MS],
+                self.result[Result.DF],
+                alpha)
+        return CI
+
+    def calculatePercent(self, Var):
+        """Calculate percentage of the total study variation.
+
+        The GageRnR entry is the %GRR of the measurement system.
+        """
+        Percent = dict()
+        for key in Var:
+            Percent[key] = 100 * np.sqrt(Var[key] / Var[Component.TOTAL])
+
+        return Percent
+
     def calculateF(self, MS):
         """Calculate F-Values."""
         F = dict()
@@ -212,6 +369,8 @@ class GageRnR(Statistics):
 
     def calculateP(self, dof, F):
         """Calculate P-Values."""
+        import scipy.stats as stats
+
         P = dict()
 
         P[Component.OPERATOR] = \
@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 """Module for generating GageRnR data."""
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 
 # y_ijk = u + pi + oj +(PO)ij+eijk
 # measurements: [o1:[p1:[m1, m2, m3],p2:[m1,m2,m3]],
 #               o2:[p1:[m1, m2, m3],p2:[m1,m2,m3]]
 
+# Default number of operator by part cells in every streamed chunk.
+CHUNK_CELLS = 2**16
+
 
 class Distribution:
     """Distribution settings used to generate data."""
@@ -14,8 +18,13 @@ class Distribution:
         self.mean = mean
         self.sigma = sigma
 
-    def batch(self):
-        return(np.random.normal(self.mean, self.sigma, self.number))
+    def batch(self, rng=None, size=None):
+        """Draw samples, from the global numpy random state if rng is None."""
+        if size is None:
+            size = self.number
+        if rng is None:
+            return np.random.normal(self.mean, self.sigma, size)
+        return rng.normal(self.mean, self.sigma, size)
 
 
 class Settings:
@@ -32,20 +41,119 @@ class Settings:
         self.size = [operators.number, parts.number, measurements.number]
 
 
+def combine(operators, parts, partOperator, measurements):
+    """Sum the effects into data n[i,j,k] = o_i + p_j + (po)_ij + e_ijk.
+
+    Every effect can have the same leading dimensions, which are kept,
+    partOperator holds the effect of every operator by part cell.
+    """
+    return \
+        operators[..., :, np.newaxis, np.newaxis] + \
+        parts[..., np.newaxis, :, np.newaxis] + \
+        partOperator[..., np.newaxis] + \
+        measurements
+
+
 class Generator:
-    def __init__(self, settings):
+    def __init__(self, settings, seed=None, dtype=np.float64):
+        """Generate data n[i,j,k] where i = operator, j = part, k = measurement.
+
+        :param Settings settings: Distributions of the study effects.
+        :param seed:
+            Seed or SeedSequence of the numpy random Generators.
+            The global numpy random state is used if None,
+            matching earlier versions draw for draw.
+        :param dtype:
+            Floating point type of the data, the effects are drawn
+            in float64 and rounded once to dtype.
+        """
         self.settings = settings
-        self.data = np.empty(settings.size, dtype=float)
+
+        if seed is not None:
+            cells = settings.operators.number * settings.parts.number
+            chunk, = Generator.stream(
+                settings, seed=seed, chunkCells=cells, dtype=dtype)
+            self.data = chunk.reshape(settings.size)
+            return
 
         operators = self.settings.operators.batch()
         parts = self.settings.parts.batch()
         partOperator = self.settings.partOperator.batch()
+        measurements = self.settings.measurements.batch(
+            size=self.settings.size)
+
+        partOperator = partOperator[:len(operators) * len(parts)]
+        self.data = combine(
+            operators,
+            parts,
+            partOperator.reshape(len(operators), len(parts)),
+            measurements)
+        self.data = self.data.astype(dtype, copy=False)
+
+    @staticmethod
+    def stream(settings, seed=None, chunkCells=CHUNK_CELLS, dtype=np.float64):
+        """Generate data as a stream of chunks.
+
+        Every chunk holds the measurements of up to chunkCells operator by
+        part cells, in the row order data.reshape(operators * parts, -1)
+        would have. Every effect is drawn from its own random stream so
+        the concatenated chunks do not depend on chunkCells.
+
+        :param Settings settings: Distributions of the study effects.
+        :param seed: Seed or SeedSequence of the numpy random Generators.
+        :param int chunkCells: Number of cells in every chunk.
+        :param dtype: Floating point type of the chunks.
+        """
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        rngs = [np.random.default_rng(sequence) for sequence in seed.spawn(4)]
+        operators = settings.operators.batch(rngs[0])
+        parts = settings.parts.batch(rngs[1])
+        measurements = settings.measurements.number
+        cells = len(operators) * len(parts)
+
+        for start in range(0, cells, chunkCells):
+            stop = min(start + chunkCells, cells)
+            operator, part = np.divmod(np.arange(start, stop), len(parts))
+            chunk = \
+                (operators[operator] +
+                 parts[part] +
+                 settings.partOperator.batch(rngs[2], stop - start))[:, np.newaxis] + \
+                settings.measurements.batch(rngs[3], (stop - start, measurements))
+            yield chunk.astype(dtype, copy=False)
+
+    @staticmethod
+    def studies(settings, count, seed=None, dtype=np.float64):
+        """Generate count independent datasets at once.
+
+        All effects of the datasets are drawn from one random stream in
+        a few vectorized calls, which Simulator uses to draw thousands
+        of small studies.
+
+        :param seed: Seed or SeedSequence of the numpy random Generator.
+        :returns: Data n[s,i,j,k] where s = dataset.
+        """
+        rng = np.random.default_rng(seed)
+        operators, parts, measurements = settings.size
+        data = combine(
+            settings.operators.batch(rng, (count, operators)),
+            settings.parts.batch(rng, (count, parts)),
+            settings.partOperator.batch(rng, (count, operators, parts)),
+            settings.measurements.batch(rng, (count, operators, parts, measurements)))
+        return data.astype(dtype, copy=False)
+
+    @staticmethod
+    def spawn(settings, count, seed=None, processes=None, dtype=np.float64):
+        """Generate independent datasets.
+
+        Every dataset is generated from its own child of the seed so their
+        random streams do not overlap, optionally on a process pool.
 
-        for i in range(0, len(operators)):
-            for j in range(0, len(parts)):
-                index = i * len(parts) + j
-                self.data[i, j, :] = \
-                    operators[i] + \
-                    parts[j] + \
-                    partOperator[index] + \
-                    self.settings.measurements.batch()
+        :returns: List of count Generators.
+        """
+        seeds = np.random.SeedSequence(seed).spawn(count)
+        if processes is None:
+            return [Generator(settings, child, dtype) for child in seeds]
+        with ProcessPoolExecutor(processes) as executor:
+            return list(executor.map(
+                Generator, [settings] * count, seeds, [dtype] * count))
@@ -0,0 +1,135 @@
+"""Module for analysing several groups of measurements in one go."""
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .statistics import Statistics, Result, Component
+from .gageRnR import GageRnR
+from .normality import Normality
+from .linearity import Linearity
+from .dataLoader import sortLabels
+
+
+def referenceByPart(groups, partGt):
+    """Reference value of every part label.
+
+    :param partGt:
+        Dict from part label to reference value, or a list of reference
+        values in order of the part labels of all groups sorted.
+    """
+    if partGt is None or isinstance(partGt, dict):
+        return partGt
+    parts = sortLabels({str(part) for _, labels in groups.values() for part in labels['Part']})
+    if len(parts) != len(partGt):
+        raise AttributeError(
+            "Ground truth has %d values but the groups have %d parts." % (len(partGt), len(parts)))
+    return dict(zip(parts, partGt))
+
+
+def analyseGroup(data, labels, partGt=None):
+    """Run the analyses of one group.
+
+    :returns:
+        Dict from the name of every analysis to the ResultTable of it,
+        Linearity is only run when partGt is given.
+    """
+    tables = dict()
+    analyses = [GageRnR(data, labels), Statistics(data, labels), Normality(data, labels)]
+    if partGt is not None:
+        analyses.append(Linearity(data, partGt, labels))
+    for analysis in analyses:
+        analysis.calculate()
+        tables[type(analysis).__name__] = analysis.table()
+    return tables
+
+
+class GroupBy(object):
+    """GageRnR, Statistics, Normality and Linearity of every group."""
+
+    title = "Gauge R&R by Group"
+
+    def __init__(self, groups, partGt=None, processes=None):
+        """Initialize GroupBy.
+
+        :param dict groups:
+            Data and labels of every group, as returned by
+            DataLoader.loadGroups.
+        :param partGt:
+            Ground truth of the parts, as a dict from part label or a list
+            in order of the sorted part labels. Linearity is only
+            calculated when it is given.
+        :param int processes:
+            Number of worker processes, groups are analysed in the
+            calling process if None.
+        """
+        self.groups = groups
+        self.partGt = referenceByPart(groups, partGt)
+        self.processes = processes
+
+    def __str__(self):
+        if not hasattr(self, 'result'):
+            return 'Groups: ' + str(list(self.groups))
+        return self.summary()
+
+    def calculate(self):
+        """Analyse every group.
+
+        :returns:
+            Dict from group to a dict of the ResultTable of every analysis.
+        """
+        names = list(self.groups)
+        data = [self.groups[name][0] for name in names]
+        labels = [self.groups[name][1] for name in names]
+        partGt = [None] * len(names)
+        if self.partGt is not None:
+            # Parts are numbered in order of appearance within every group.
+            partGt = [
+                [self.partGt[str(part)] for part in self.groups[name][1]['Part']]
+                for name in names]
+        if self.processes is None:
+            tables = list(map(analyseGroup, data, labels, partGt))
+        else:
+            with ProcessPoolExecutor(self.processes) as executor:
+                tables = list(executor.map(analyseGroup, data, labels, partGt))
+
+        self.result = dict(zip(names, tables))
+        return self.result
+
+    def order(self):
+        """Groups sorted by decreasing %GRR."""
+        return sorted(
+            self.result,
+            key=lambda name: -float(self.result[name]['GageRnR'][Result.Percent][GageRnR.GRR]))
+
+    def summary(self, tableFormat="fancy_grid", precision='.3f'):
+        """Convert result to one table with a row per group sorted by %GRR."""
+        if not hasattr(self, 'result'):
+            raise Exception(
+                'GroupBy.calculate() should be run before calling summary()')
+
+        headers = ['Group', '% GageRnR', 'Var GageRnR', 'Var Part',
+                   'Mean', 'Std', 'Normality P-value']
+        linearity = self.partGt is not None
+        if linearity:
+            headers += ['Linearity', 'Bias']
+
+        table = []
+        for name in self.order():
+            tables = self.result[name]
+            values = [
+                tables['GageRnR'][Result.Percent][GageRnR.GRR],
+                tables['GageRnR'][Result.Var][GageRnR.GRR],
+                tables['GageRnR'][Result.Var][Component.PART],
+                tables['Statistics'][Result.Mean][Component.TOTAL],
+                tables['Statistics'][Result.Std][Component.TOTAL],
+                tables['Normality'][Result.P][Component.TOTAL]]
+            if linearity:
+                values += [
+                    tables['Linearity'][Result.K][Component.TOTAL],
+                    tables['Linearity'][Result.Bias][Component.TOTAL]]
+            table.append([name] + [
+                format(float(np.ravel(value)[0]), precision) for value in values])
+
+        from tabulate import tabulate
+        return tabulate(
+            table,
+            headers=headers,
+            tablefmt=tableFormat)
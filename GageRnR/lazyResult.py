@@ -0,0 +1,42 @@
+"""Module containing a lazily evaluated result mapping."""
+from collections.abc import Mapping
+
+
+class LazyResult(Mapping):
+    """Mapping from Result to values computed on first access.
+
+    Every entry is created by a function that receives the mapping
+    itself, so it can look up the entries it depends on. Computed
+    entries are memoized until invalidate() is called.
+    """
+
+    def __init__(self, factories):
+        """Initialize LazyResult.
+
+        :param dict factories:
+            Function computing the value of every Result from the mapping.
+        """
+        self.factories = factories
+        self.values = dict()
+
+    def __getitem__(self, key):
+        if key not in self.values:
+            self.values[key] = self.factories[key](self)
+        return self.values[key]
+
+    def __iter__(self):
+        return iter(self.factories)
+
+    def __len__(self):
+        return len(self.factories)
+
+    def __repr__(self):
+        return 'LazyResult(' + repr(dict(self)) + ')'
+
+    def isCalculated(self, key):
+        """True if the entry has been computed."""
+        return key in self.values
+
+    def invalidate(self):
+        """Forget all computed entries."""
+        self.values.clear()
@@ -1,8 +1,5 @@
 import numpy as np
-from tabulate import tabulate
 from .statistics import Statistics, Result, Component
-import statsmodels.api as sm
-import plotly.graph_objects as go
 
 ResultNames = {
     Result.K: 'Linearity',
@@ -13,8 +10,8 @@ ResultNames = {
 class Linearity(Statistics):
     title = "Linearity and Bias"
 
-    def __init__(self, data, partGt=None):
-        super().__init__(data)
+    def __init__(self, data, partGt=None, labels=None):
+        super().__init__(data, labels)
         if(partGt is None):
             self.gt = self.calculateMean()[Component.PART]
         else:
@@ -43,6 +40,7 @@ class Linearity(Statistics):
         results = [Result.K, Result.Bias, Result.P]
         self.addToTable(results, Component.TOTAL, table, precision)
 
+        from tabulate import tabulate
         return tabulate(
             table,
             headers=headers,
@@ -69,8 +67,10 @@ class Linearity(Statistics):
         return K, Bias, P
 
     def estimateCoef(self, x, y):
+        import statsmodels.api as sm
+
         x = sm.add_constant(x, prepend=False)
-        mod = sm.OLS(y, x)
+        mod = sm.OLS(y, x, missing='drop')
         self.advancedRes = mod.fit()
 
         return (
@@ -79,6 +79,7 @@ class Linearity(Statistics):
             np.array([float(self.advancedRes.pvalues[0])]))
 
     def createLinearityPlot(self):
+        import plotly.graph_objects as go
 
         X, Y = self.calculatePartResiduals()
         min = np.amin(X)
@@ -1,6 +1,4 @@
 import numpy as np
-from scipy.stats import shapiro
-from tabulate import tabulate
 from .statistics import Statistics, Result, Component
 
 ResultNames = {
@@ -8,9 +6,15 @@ ResultNames = {
     Result.P: 'P-value'}
 
 
+def present(data):
+    """Flattened data without missing measurements."""
+    data = np.ravel(data)
+    return data[~np.isnan(data)]
+
+
 class Normality(Statistics):
-    def __init__(self, data):
-        super().__init__(data)
+    def __init__(self, data, labels=None):
+        super().__init__(data, labels)
 
     title = "Shapiro-Wilk Test"
 
@@ -38,6 +42,7 @@ class Normality(Statistics):
         self.addToTable(results, Component.OPERATOR, table, precision)
         self.addToTable(results, Component.PART, table, precision)
 
+        from tabulate import tabulate
         return tabulate(
             table,
             headers=headers,
@@ -58,8 +63,14 @@ class Normality(Statistics):
         return W, P
 
     def shapiro(self, axis=-1):
+        """Shapiro-Wilk Test of all, per operator or per part measurements.
+
+        Missing measurements marked as NaN are left out of the test.
+        """
+        from scipy.stats import shapiro
+
         if(axis < 0):
-            W, P = shapiro(self.data)
+            W, P = shapiro(present(self.data))
             return np.array([W]), np.array([P])
 
         if(axis > len(self.data.shape)):
@@ -71,8 +82,8 @@ class Normality(Statistics):
 
         for i in range(0, size):
             if(axis == 0):
-                W[i], P[i] = shapiro(self.data[i, :, :])
+                W[i], P[i] = shapiro(present(self.data[i, :, :]))
             elif(axis == 1):
-                W[i], P[i] = shapiro(self.data[:, i, :])
+                W[i], P[i] = shapiro(present(self.data[:, i, :]))
 
         return W, P
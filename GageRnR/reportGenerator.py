@@ -1,26 +1,93 @@
+from concurrent.futures import ProcessPoolExecutor
 import os
-import plotly
-from pkg_resources import resource_string
+import tempfile
+
+STYLESHEET = 'bootstrap.min.css'
+
+
+def plotlyAsset():
+    """File name of the plotly.js bundle, versioned so upgrades get a new file."""
+    import plotly
+
+    return 'plotly-' + plotly.__version__ + '.min.js'
+
+
+def writeAsset(path, read):
+    """Write an asset unless it exists, read returns its content.
+
+    The asset is written to a temporary file and moved in place, so
+    reports written concurrently never see a partial file.
+    """
+    if os.path.exists(path):
+        return False
+    folder, filename = os.path.split(path)
+    fd, tmp = tempfile.mkstemp(dir=folder, prefix='.' + filename)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(read())
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    return True
+
+
+def renderPlot(plot, filename, plotlyjs):
+    """Serialize a figure to a html page loading plotly.js from plotlyjs."""
+    import plotly.offline
+
+    plotly.offline.plot(
+        plot,
+        filename=filename,
+        include_plotlyjs=plotlyjs,
+        auto_open=False)
 
 
 class ReportGenerator():
     report = '''
 <html>
     <head>
-        <link rel="stylesheet" href="bootstrap.min.css">
+        <link rel="stylesheet" href="%s">
         <style>body{ margin:0 100; background:whitesmoke; }</style>
     </head>
     <body>
         <div class="container">
             <div class="col-md-10">'''
 
-    def __init__(self, outputFolder):
-        if not os.path.isdir(outputFolder):
-            try:
-                os.makedirs(outputFolder)
-            except OSError:  # Guard against race condition
-                raise
+    def __init__(self, outputFolder, assetFolder=None, processes=None):
+        """Initialize ReportGenerator.
+
+        :param str outputFolder: Folder the report is written to.
+        :param str assetFolder:
+            Folder of the plotly.js bundle and stylesheet shared by the
+            plots and reports of an output tree, outputFolder if None.
+        :param int processes:
+            Number of worker processes rendering the plots while the
+            report is assembled, plots are rendered by addPlot if None.
+        """
+        if assetFolder is None:
+            assetFolder = outputFolder
+        for folder in [outputFolder, assetFolder]:
+            if not os.path.isdir(folder):
+                try:
+                    os.makedirs(folder)
+                except OSError:  # Guard against race condition
+                    raise
         self.outputFolder = outputFolder
+        self.assetFolder = assetFolder
+        self.report = self.report % self.assetUrl(STYLESHEET)
+        self.processes = processes
+        self.executor = None
+        self.renders = []
+
+    def assetUrl(self, filename):
+        """Url of an asset relative to the report."""
+        path = os.path.relpath(os.path.join(self.assetFolder, filename), self.outputFolder)
+        return path.replace(os.sep, '/')
+
+    def writeAsset(self, filename, read):
+        return writeAsset(os.path.join(self.assetFolder, filename), read)
 
     def addTitle(self, title):
         self.report += '\n<h1>' + title + '</h1>'
@@ -37,26 +104,44 @@ class ReportGenerator():
         self.report += '\n' + table
 
     def addPlot(self, plot, name):
+        import plotly.offline
+
         self.report += '\n<h2>' + name + '</h2>'
         plotUrl = name + '.html'
-        plotly.offline.plot(
-            plot,
-            filename=self.outputFolder + '/' + plotUrl,
-            auto_open=False)
+        plotlyjs = plotlyAsset()
+        self.writeAsset(plotlyjs, plotly.offline.get_plotlyjs)
+        arguments = (plot, self.outputFolder + '/' + plotUrl, self.assetUrl(plotlyjs))
+        if self.processes is None:
+            renderPlot(*arguments)
+        else:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(self.processes)
+            self.renders.append(self.executor.submit(renderPlot, *arguments))
         self.report += '''
         <iframe width="1000" height="550" frameborder="0" seamless="seamless" scrolling="no" \
 src="''' + plotUrl + '''"></iframe>'''
 
+    def waitForPlots(self):
+        """Wait until every plot is written, raising the first error."""
+        if self.executor is None:
+            return
+        try:
+            for render in self.renders:
+                render.result()
+        finally:
+            self.executor.shutdown()
+            self.executor = None
+            self.renders = []
+
     def generateReport(self):
+        self.waitForPlots()
         self.report += '''
             </div>
         </div>
     </body>
 </html>'''
         self.write('index.html', self.report)
-        self.write(
-            'bootstrap.min.css',
-            resource_string('GageRnR.resources', 'bootstrap.min.css').decode("utf-8"))
+        self.writeAsset(STYLESHEET, lambda: self.readResource(STYLESHEET))
 
     def write(self, filename, data):
         f = open(self.outputFolder + '/' + filename, 'w')
@@ -64,4 +149,6 @@ src="''' + plotUrl + '''"></iframe>'''
         f.close()
 
     def readResource(self, filename):
+        from pkg_resources import resource_string
+
         return resource_string('GageRnR.resources', filename).decode("utf-8")
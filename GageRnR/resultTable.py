@@ -0,0 +1,170 @@
+"""Module containing a compact, array backed result container."""
+from collections.abc import Mapping
+import numpy as np
+
+
+class ResultTable(Mapping):
+    """Results stored in one component by metric float matrix.
+
+    A component occupies one row per value, per operator results take
+    one row per operator. The matrix of every study is stacked along
+    the leading axes of values so many results are held in one array.
+    Indexing a metric gives a view with the dict access of the result
+    it was created from, result[Result.Var][Component.PART].
+    """
+
+    __slots__ = ('values', 'present', 'scalar', 'metrics', 'components', 'layout')
+
+    def __init__(self, values, present, scalar, metrics, components, layout):
+        """Initialize ResultTable.
+
+        :param numpy.array values:
+            Array n[..., r, m] where r = row, m = metric, missing
+            entries are NaN.
+        :param numpy.array present: Mask n[r, m] of the entries in the result.
+        :param numpy.array scalar:
+            Mask n[c, m] where c = component of the entries that
+            are scalars per study.
+        :param tuple metrics: Result of every column.
+        :param tuple components: Component of every row block.
+        :param dict layout: Slice of the rows of every component.
+        """
+        self.values = values
+        self.present = present
+        self.scalar = scalar
+        self.metrics = metrics
+        self.components = components
+        self.layout = layout
+
+    @classmethod
+    def fromDict(cls, result, batch=()):
+        """Create ResultTable from a dict of Result to dicts of Component.
+
+        :param dict result: Result as returned by calculate().
+        :param tuple batch: Shape of the studies stacked in the result.
+        """
+        metrics = tuple(result)
+        shapes = dict()
+        for metric in metrics:
+            for component, value in result[metric].items():
+                shapes[(component, metric)] = np.shape(value)[len(batch):]
+        components = tuple(dict.fromkeys(c for c, _ in shapes))
+
+        layout = dict()
+        rows = 0
+        for component in components:
+            width = max(
+                int(np.prod(shapes[(component, metric)]))
+                for metric in metrics if (component, metric) in shapes)
+            layout[component] = slice(rows, rows + width)
+            rows += width
+
+        values = np.full(tuple(batch) + (rows, len(metrics)), np.nan)
+        present = np.zeros((rows, len(metrics)), dtype=bool)
+        scalar = np.zeros((len(components), len(metrics)), dtype=bool)
+        for (component, metric), shape in shapes.items():
+            i = components.index(component)
+            j = metrics.index(metric)
+            start = layout[component].start
+            size = int(np.prod(shape))
+            value = np.reshape(result[metric][component], tuple(batch) + (size,))
+            values[..., start:start + size, j] = value
+            present[start:start + size, j] = True
+            scalar[i, j] = shape == ()
+        return cls(values, present, scalar, metrics, components, layout)
+
+    @classmethod
+    def stack(cls, tables):
+        """Stack results with the same layout along a new leading axis.
+
+        The values of all tables are copied once into a new array, the
+        stacked table does not share memory with the tables.
+        """
+        return cls.join(tables, np.stack)
+
+    @classmethod
+    def concatenate(cls, tables):
+        """Concatenate batched results with the same layout, copying the values once."""
+        return cls.join(tables, np.concatenate)
+
+    @classmethod
+    def join(cls, tables, function):
+        first = tables[0]
+        for table in tables[1:]:
+            if table.metrics != first.metrics or table.layout != first.layout:
+                raise AttributeError("Results do not share the same layout.")
+        return cls(
+            function([table.values for table in tables]),
+            first.present,
+            first.scalar,
+            first.metrics,
+            first.components,
+            first.layout)
+
+    @property
+    def batch(self):
+        return self.values.shape[:-2]
+
+    def study(self, index):
+        """View of the result of one stacked study, sharing the values without a copy."""
+        return ResultTable(
+            self.values[index],
+            self.present,
+            self.scalar,
+            self.metrics,
+            self.components,
+            self.layout)
+
+    def get(self, metric, component, default=None):
+        """Value of a metric for a component, a view of values."""
+        j = self.metrics.index(metric)
+        rows = self.layout.get(component)
+        if rows is None or not self.present[rows, j].any():
+            return default
+        if self.scalar[self.components.index(component), j]:
+            return self.values[..., rows.start, j]
+        size = int(np.count_nonzero(self.present[rows, j]))
+        return self.values[..., rows.start:rows.start + size, j]
+
+    def toDict(self):
+        """Convert to a dict of Result to dicts of Component."""
+        return {metric: dict(self[metric]) for metric in self.metrics}
+
+    def __getitem__(self, metric):
+        if metric not in self.metrics:
+            raise KeyError(metric)
+        return ResultColumn(self, metric)
+
+    def __iter__(self):
+        return iter(self.metrics)
+
+    def __len__(self):
+        return len(self.metrics)
+
+    def __repr__(self):
+        return 'ResultTable(' + repr(self.toDict()) + ')'
+
+
+class ResultColumn(Mapping):
+    """View of one metric of a ResultTable keyed by Component."""
+
+    __slots__ = ('table', 'metric')
+
+    def __init__(self, table, metric):
+        self.table = table
+        self.metric = metric
+
+    def __getitem__(self, component):
+        value = self.table.get(self.metric, component)
+        if value is None:
+            raise KeyError(component)
+        return value
+
+    def __iter__(self):
+        j = self.table.metrics.index(self.metric)
+        return (
+            component for component in self.table.components
+            if self.table.present[self.table.layout[component], j].any())
+
+    def __len__(self):
+        return sum(1 for _ in self)
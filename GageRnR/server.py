@@ -0,0 +1,188 @@
+"""Module containing a local HTTP server analysing studies on request.
+
+The server keeps the library imported so a study is analysed without
+the start up cost of the CLI. A study is posted to /analyse as csv
+text or a .npy/raw binary array, the options of the CLI are passed
+as query parameters:
+
+    curl --data-binary @data.csv "localhost:8080/analyse?structure=3,10,3&axes=0,2,1"
+
+The analyses are returned as JSON, or the report as a zip archive
+when report=1 is passed.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from urllib.parse import urlparse, parse_qs
+import io
+import json
+import os
+import tempfile
+import zipfile
+import numpy as np
+from .statistics import ComponentNames
+from .groupBy import analyseGroup
+
+# Extension of the file a payload is stored in, by format.
+Formats = {'csv': '.csv', 'npy': '.npy', 'raw': '.raw'}
+
+
+def toJson(tables):
+    """Convert the ResultTable of every analysis to JSON compatible dicts."""
+    result = dict()
+    for name, table in tables.items():
+        result[name] = dict()
+        for metric in table:
+            result[name][metric.name] = {
+                ComponentNames.get(component, component): np.asarray(value).tolist()
+                for component, value in table[metric].items()}
+    return result
+
+
+def arguments(file, query, outputFolder=None):
+    """CLI arguments analysing file with the options of a query."""
+    argv = ['-f', file, '-s', query['structure']]
+    for option, name in [
+            ('-a', 'axes'),
+            ('-d', 'delimiter'),
+            ('-m', 'multiply'),
+            ('-g', 'groundTruth'),
+            ('-t', 'dtype')]:
+        if name in query:
+            argv += [option, query[name]]
+    if outputFolder is not None:
+        argv += ['-o', outputFolder]
+    return argv
+
+
+def analyse(payload, query):
+    """Analyse a posted study.
+
+    :param bytes payload: The study as csv text or a binary array.
+    :param dict query: Options of the study, see the CLI.
+    :returns: Content type and body of the response.
+    """
+    from .application import Application
+
+    if 'structure' not in query:
+        raise AttributeError("The structure of the study is required.")
+    fileFormat = query.get('format', 'csv')
+    if fileFormat not in Formats:
+        raise AttributeError("Format can only be one of " + str(list(Formats)))
+
+    with tempfile.TemporaryDirectory() as folder:
+        file = os.path.join(folder, 'data' + Formats[fileFormat])
+        with open(file, 'wb') as f:
+            f.write(payload)
+
+        if query.get('report', '0') != '1':
+            app = Application(arguments(file, query))
+            app.check()
+            tables = analyseGroup(app.load(), None, partGt=getattr(app, 'gt', None))
+            return 'application/json', json.dumps(toJson(tables)).encode()
+
+        outputFolder = os.path.join(folder, 'report')
+        app = Application(arguments(file, query, outputFolder))
+        app.check()
+        app.run()
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as z:
+            for name in sorted(os.listdir(outputFolder)):
+                z.write(os.path.join(outputFolder, name), name)
+        return 'application/zip', archive.getvalue()
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """Handler of the requests of a Server."""
+
+    def do_GET(self):
+        if urlparse(self.path).path == '/health':
+            from . import __version__
+            self.respond(200, {'status': 'ok', 'version': __version__})
+        else:
+            self.respond(404, {'error': 'Not found: ' + self.path})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != '/analyse':
+            return self.respond(404, {'error': 'Not found: ' + self.path})
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        payload = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        try:
+            contentType, body = self.server.analyse(payload, query)
+        except Exception as error:
+            return self.respond(400, {'error': str(error)})
+        self.send(200, contentType, body)
+
+    def respond(self, status, result):
+        self.send(status, 'application/json', json.dumps(result).encode())
+
+    def send(self, status, contentType, body):
+        self.send_response(status)
+        self.send_header('Content-Type', contentType)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix sockets have no client address.
+        return str(self.client_address[0]) if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+class Server(object):
+    """HTTP server analysing studies on a pool of worker processes."""
+
+    def __init__(self, host='127.0.0.1', port=8080, socket=None, processes=None, quiet=False):
+        """Initialize Server.
+
+        :param str host: Address to listen on, localhost by default.
+        :param int port: Port to listen on, 0 picks a free port.
+        :param str socket: Path of a Unix socket to listen on instead.
+        :param int processes:
+            Number of worker processes, studies are analysed in the
+            thread handling the request if None.
+        :param bool quiet: Do not log the requests.
+        """
+        if socket is not None:
+            if os.path.exists(socket):
+                os.remove(socket)
+            self.httpd = ThreadingUnixHTTPServer(socket, RequestHandler)
+        else:
+            self.httpd = ThreadingHTTPServer((host, port), RequestHandler)
+        self.httpd.analyse = self.analyse
+        self.httpd.quiet = quiet
+        self.executor = None
+        if processes is not None:
+            self.executor = ProcessPoolExecutor(processes)
+
+    @property
+    def address(self):
+        return self.httpd.server_address
+
+    def analyse(self, payload, query):
+        if self.executor is None:
+            return analyse(payload, query)
+        return self.executor.submit(analyse, payload, query).result()
+
+    def serveForever(self):
+        """Handle requests until shutdown() is called."""
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.close()
+
+    def shutdown(self):
+        self.httpd.shutdown()
+
+    def close(self):
+        self.httpd.server_close()
+        if self.executor is not None:
+            self.executor.shutdown()
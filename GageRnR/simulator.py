@@ -0,0 +1,149 @@
+"""Module for simulating the outcome of GageRnR study designs."""
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .statistics import Result, Component, ComponentNames
+from .gageRnR import GageRnR
+from .generator import Distribution, Settings, Generator
+from .resultTable import ResultTable
+
+# Upper bound on the number of measurements simulated in one batch.
+BLOCK_SIZE = 2**22
+
+# Upper bound on the number of studies simulated in one batch, batches
+# do not depend on the number of processes so results are reproducible.
+BATCH_STUDIES = 256
+
+Quantiles = [5, 50, 95]
+
+
+def designSettings(settings, design):
+    """Settings with the number of every effect replaced by a design."""
+    operators, parts, measurements = design
+    return Settings(
+        Distribution(operators, settings.operators.mean, settings.operators.sigma),
+        Distribution(parts, settings.parts.mean, settings.parts.sigma),
+        Distribution(
+            operators * parts, settings.partOperator.mean, settings.partOperator.sigma),
+        Distribution(measurements, settings.measurements.mean, settings.measurements.sigma))
+
+
+def simulateStudies(settings, design, studies, seed):
+    """Simulate a batch of studies and calculate their variances.
+
+    The studies are drawn by Generator.studies and analysed by GageRnR
+    as one batch.
+
+    :param Settings settings: Distributions of the study effects.
+    :param tuple design: Number of operators, parts and measurements.
+    :param int studies: Number of studies to simulate.
+    :param seed: Seed or SeedSequence of the random number generator.
+    :returns: ResultTable of the Var and Percent of every study.
+    """
+    g = GageRnR(Generator.studies(designSettings(settings, design), studies, seed))
+    MS = g.calculateMS(g.calculateDoF(), g.calculateSS())
+    Var = g.calculateVar(MS)
+    return ResultTable.fromDict({
+        Result.Var: Var,
+        Result.Percent: g.calculatePercent(Var)}, (studies,))
+
+
+class Simulator(object):
+    """Monte Carlo simulation of candidate GageRnR study designs."""
+
+    title = "Study Design Simulation"
+
+    def __init__(
+            self,
+            settings,
+            designs=None,
+            studies=1000,
+            seed=None,
+            processes=None):
+        """Initialize Simulator.
+
+        :param Settings settings:
+            Distributions of the operator, part, part by operator and
+            measurement effects. Their number is replaced by the design.
+        :param designs:
+            List of (operators, parts, measurements) tuples, defaults
+            to the numbers in settings.
+        :param int studies: Number of studies simulated per design.
+        :param seed: Seed of the random number generator.
+        :param int processes:
+            Number of worker processes, studies are simulated in the
+            calling process if None.
+        """
+        self.settings = settings
+        if designs is None:
+            designs = [tuple(settings.size)]
+        self.designs = [tuple(design) for design in designs]
+        self.studies = studies
+        self.seed = seed
+        self.processes = processes
+
+    def __str__(self):
+        if not hasattr(self, 'result'):
+            return 'Designs: ' + str(self.designs)
+        return self.summary()
+
+    def summary(self, tableFormat="fancy_grid", precision='.3f', result=Result.Percent):
+        """Convert the sampling distribution of a result to tabular."""
+        if not hasattr(self, 'result'):
+            raise Exception(
+                'Simulator.calculate() should be run before calling summary()')
+
+        headers = ['Design', 'Sources of Variance', 'Mean', 'Std'] + \
+            [str(q) + '%' for q in Quantiles]
+
+        names = dict(ComponentNames)
+        names[GageRnR.GRR] = GageRnR.GRR
+
+        table = []
+        for design in self.designs:
+            for key in [Component.OPERATOR, Component.PART, GageRnR.GRR]:
+                samples = self.result[design][result][key]
+                row = ['x'.join(str(n) for n in design), names[key]]
+                values = [np.mean(samples), np.std(samples)] + \
+                    list(np.percentile(samples, Quantiles))
+                for value in values:
+                    row.append(format(value, precision))
+                table.append(row)
+
+        from tabulate import tabulate
+        return tabulate(
+            table,
+            headers=headers,
+            tablefmt=tableFormat)
+
+    def createTasks(self):
+        """Split the simulation into batches with independent seeds."""
+        sequences = np.random.SeedSequence(self.seed).spawn(len(self.designs))
+        tasks = []
+        for design, sequence in zip(self.designs, sequences):
+            step = max(1, min(BATCH_STUDIES, BLOCK_SIZE // int(np.prod(design))))
+            sizes = [min(step, self.studies - i) for i in range(0, self.studies, step)]
+            for size, seed in zip(sizes, sequence.spawn(len(sizes))):
+                tasks.append((self.settings, design, size, seed))
+        return tasks
+
+    def calculate(self):
+        """Simulate all designs.
+
+        :returns:
+            Dict with a ResultTable of the sampled Var and Percent of
+            every variance component for every design.
+        """
+        tasks = self.createTasks()
+        if self.processes is None:
+            batches = [simulateStudies(*task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(self.processes) as executor:
+                batches = list(executor.map(simulateStudies, *zip(*tasks)))
+
+        self.result = dict()
+        for design in self.designs:
+            self.result[design] = ResultTable.concatenate([
+                batch for task, batch in zip(tasks, batches)
+                if task[1] == design])
+
+        return self.result
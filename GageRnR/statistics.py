@@ -1,42 +1,7 @@
-from enum import Enum
-import numpy as np
-from tabulate import tabulate
-import plotly.graph_objects as go
-
-
-class Component(Enum):
-    """Enum containing the different Variance parts of GageRnR."""
-
-    OPERATOR = 0
-    PART = 1
-    OPERATOR_BY_PART = 2
-    MEASUREMENT = 3
-    TOTAL = 4
-
-
-ComponentNames = {
-    Component.OPERATOR: 'Operator',
-    Component.PART: 'Part',
-    Component.OPERATOR_BY_PART: 'Operator by Part',
-    Component.MEASUREMENT: 'Measurement',
-    Component.TOTAL: 'Total'}
-
-
-class Result(Enum):
-    """Enum containing the measurements calculated by GageRnR."""
-
-    DF = 0
-    Mean = 1
-    SS = 3
-    MS = 4
-    Var = 5
-    Std = 6
-    F = 7
-    P = 8
-    W = 9
-    K = 10
-    Bias = 11
-
+from .enums import Component, ComponentNames, Result
+from .dataset import Dataset
+from .lazyResult import LazyResult
+from .resultTable import ResultTable
 
 ResultNames = {
     Result.Mean: 'Mean',
@@ -48,10 +13,15 @@ class Statistics(object):
     title = "Statistics"
 
     def __init__(self, data, labels=None):
+        """Initialize Statistics.
+
+        :param data:
+            A numpy array n[i,j,k] where i = operator, j = part,
+            k = measurement or CellStatistics reduced from such data.
+            A Dataset can be passed to share its memoized marginals
+            between several analyses.
+        """
         self.data = data
-        self.parts = data.shape[1]
-        self.operators = data.shape[0]
-        self.measurements = data.shape[2]
         if labels is None:
             self.labels = {}
         else:
@@ -63,6 +33,23 @@ class Statistics(object):
         if "Part" not in self.labels:
             self.labels["Part"] = [("Part %d" % x) for x in range(self.parts)]
 
+    @property
+    def data(self):
+        return self.dataset.data
+
+    @data.setter
+    def data(self, data):
+        """Replace the data, lazily computed results are invalidated."""
+        if not isinstance(data, Dataset):
+            data = Dataset(data)
+        self.dataset = data
+        self.parts = data.shape[-2]
+        self.operators = data.shape[-3]
+        self.measurements = data.shape[-1]
+        self.batch = data.shape[:-3]
+        if isinstance(getattr(self, 'result', None), LazyResult):
+            self.result.invalidate()
+
     def __str__(self):
         """Enum containing the measurements calculated by Statistics."""
         if not hasattr(self, 'result'):
@@ -86,12 +73,15 @@ class Statistics(object):
         self.addToTable(results, Component.OPERATOR, table, precision)
         self.addToTable(results, Component.PART, table, precision)
 
+        from tabulate import tabulate
         return tabulate(
             table,
             headers=headers,
             tablefmt=tableFormat)
 
     def createOperatorsBoxData(self):
+        import plotly.graph_objects as go
+
         data = []
         for i in range(0, self.operators):
             data.append(go.Box(
@@ -103,11 +93,15 @@ class Statistics(object):
         return data
 
     def createOperatorsBoxPlot(self):
+        import plotly.graph_objects as go
+
         data = self.createOperatorsBoxData()
         fig = go.Figure(data=data)
         return fig
 
     def createPartsBoxData(self):
+        import plotly.graph_objects as go
+
         data = []
         for i in range(0, self.parts):
             data.append(go.Box(
@@ -119,6 +113,8 @@ class Statistics(object):
         return data
 
     def createPartsBoxPlot(self):
+        import plotly.graph_objects as go
+
         data = self.createPartsBoxData()
         fig = go.Figure(data=data)
         return fig
@@ -136,51 +132,26 @@ class Statistics(object):
 
     def calculateMean(self):
         """Calculate Mean."""
-        mu = np.array([np.mean(self.data)])
-
-        omu = np.mean(self.data, axis=1)
-        omu = np.mean(omu, axis=1)
-
-        pmu = np.mean(self.data, axis=0)
-        pmu = np.mean(pmu, axis=1)
-
-        emu = np.mean(self.data, axis=2)
-        emu = emu.reshape(self.parts * self.operators)
-
-        return {
-            Component.TOTAL: mu,
-            Component.OPERATOR: omu,
-            Component.PART: pmu,
-            Component.MEASUREMENT: emu}
+        return self.dataset.mean()
 
     def calculateStd(self):
-        std = np.array([np.std(self.data, ddof=1)])
-        stdo = np.std(
-            self.dataToOperators(),
-            axis=1,
-            ddof=1)
-        stdp = np.std(
-            self.dataToParts(),
-            axis=1,
-            ddof=1)
-        return {
-            Component.TOTAL: std,
-            Component.OPERATOR: stdo,
-            Component.PART: stdp
-        }
+        """Calculate Std."""
+        return self.dataset.std()
 
     def calculate(self):
         self.result = dict()
         self.result[Result.Mean] = self.calculateMean()
         self.result[Result.Std] = self.calculateStd()
 
+    def table(self):
+        """Convert result to a compact ResultTable."""
+        if not hasattr(self, 'result'):
+            raise Exception(
+                self.__class__.__name__ + '.calculate() should be run before calling table()')
+        return ResultTable.fromDict(self.result, self.batch)
+
     def dataToParts(self):
-        data = np.transpose(self.data, axes=(1, 0, 2))
-        return data.reshape(
-                self.parts,
-                self.measurements*self.operators)
+        return self.dataset.parts()
 
     def dataToOperators(self):
-        return self.data.reshape(
-            self.operators,
-            self.measurements*self.parts)
+        return self.dataset.operators()
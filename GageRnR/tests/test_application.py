@@ -1,6 +1,12 @@
 import unittest
-from GageRnR import main
+from GageRnR import main, Result, Component
 import os
+import pickle
+import shutil
+from GageRnR.application import Application, studyNames, runStudy
+from unittest.mock import patch
+import numpy as np
+from GageRnR.reportGenerator import plotlyAsset
 
 
 class MainTest(unittest.TestCase):
@@ -91,6 +97,178 @@ class MainTest(unittest.TestCase):
         self.assertTrue(os.path.exists('build/gtReport/Parts Box Plot.html'))
         self.assertTrue(os.path.exists('build/gtReport/Residual Linearity Plot.html'))
         self.assertTrue(os.path.exists('build/gtReport/bootstrap.min.css'))
+        self.assertTrue(os.path.exists('build/gtReport/' + plotlyAsset()))
+        plot = 'build/gtReport/Residual Linearity Plot.html'
+        self.assertLess(os.path.getsize(plot), 100000)
+        with open(plot) as f:
+            self.assertIn('src="' + plotlyAsset() + '"', f.read())
+
+    def test_GenerateReportParallelPlots(self):
+        for folder, jobs in [('build/serialPlots', []), ('build/parallelPlots', ['-j', '2'])]:
+            main(['-f', "data/data_demoGRnR.csv",
+                  "-s", "3,10,3",
+                  "-a", "0,2,1",
+                  "-o", folder,
+                  "-g", "40,42,30,43,29,45,27.5,42,26,35"] + jobs)
+        for name in ['Operators Box Plot.html', 'Parts Box Plot.html', 'Residual Linearity Plot.html']:
+            self.assertTrue(os.path.exists('build/parallelPlots/' + name))
+        with open('build/serialPlots/index.html') as serial, open('build/parallelPlots/index.html') as parallel:
+            self.assertEqual(serial.read(), parallel.read())
+
+    def test_GenerateReportOutOfCore(self):
+        main(['-f', "data/data_demoGRnR.csv",
+              "-s", "3,10,3",
+              "-a", "0,2,1",
+              "-l", "0.01",
+              "-o", 'build/outOfCoreReport'])
+        self.assertTrue(os.path.exists('build/outOfCoreReport/index.html'))
+        self.assertFalse(os.path.exists('build/outOfCoreReport/Parts Box Plot.html'))
+
+    def test_GenerateReportFloat32(self):
+        main(['-f', "data/data_demoGRnR.csv",
+              "-s", "3,10,3",
+              "-a", "0,2,1",
+              "-t", "float32",
+              "-o", 'build/float32Report'])
+        self.assertTrue(os.path.exists('build/float32Report/index.html'))
+
+    def test_GenerateReportMemoryMapped(self):
+        os.makedirs('build', exist_ok=True)
+        np.save('build/data_demoGRnR.npy', np.loadtxt("data/data_demoGRnR.csv", delimiter=','))
+        main(['-f', "build/data_demoGRnR.npy",
+              "-s", "3,10,3",
+              "-a", "0,2,1",
+              "-m", "2",
+              "-o", 'build/memoryMappedReport'])
+        self.assertTrue(os.path.exists('build/memoryMappedReport/index.html'))
+
+    def test_GenerateReportCached(self):
+        arguments = ['-f', "data/data_demoGRnR.csv",
+                     "-s", "3,10,3",
+                     "-a", "0,2,1",
+                     "-c", 'build/cache',
+                     "-o", 'build/cachedReport']
+        main(arguments)
+        with patch('GageRnR.DataLoader.load') as load:
+            main(arguments)
+        load.assert_not_called()
+        self.assertTrue(os.path.exists('build/cachedReport/index.html'))
+
+    def test_GenerateReportWide(self):
+        main(['-f', "data/data_wide.csv",
+              "-w",
+              "-o", 'build/wideReport'])
+        self.assertTrue(os.path.exists('build/wideReport/index.html'))
+        with open('build/wideReport/index.html') as f:
+            report = f.read()
+        self.assertIn('diameter', report)
+        self.assertIn('height', report)
+
+    def test_WideMultiply(self):
+        results = []
+        for scalar in ['1', '2']:
+            app = Application(['-f', "data/data_wide.csv", "-w", "-m", scalar])
+            app.check()
+            results.append(app.run().result)
+        np.testing.assert_allclose(
+            results[1][Result.Var][Component.PART], 4 * results[0][Result.Var][Component.PART])
+
+    def test_GenerateReportGroupBy(self):
+        main(['-f', "data/data_groups.csv",
+              "-k", "gauge",
+              "-j", "2",
+              "-o", 'build/groupReport'])
+        self.assertTrue(os.path.exists('build/groupReport/index.html'))
+        with open('build/groupReport/index.html') as f:
+            report = f.read()
+        self.assertLess(report.index('G2'), report.index('G1'))
+
+    def test_GroupByMultiply(self):
+        results = []
+        for scalar in ['1', '2']:
+            app = Application(['-f', "data/data_groups.csv", "-k", "gauge", "-m", scalar])
+            app.check()
+            results.append(app.run().result)
+        for name in ['G1', 'G2']:
+            np.testing.assert_allclose(
+                results[1][name]['GageRnR'][Result.Var][Component.PART],
+                4 * results[0][name]['GageRnR'][Result.Var][Component.PART])
+
+    def test_GenerateReportBatch(self):
+        os.makedirs('build/batch', exist_ok=True)
+        for name in ['first', 'second']:
+            shutil.copy("data/data_demoGRnR.csv", 'build/batch/' + name + '.csv')
+        with open('build/batch/broken.csv', 'w') as f:
+            f.write('1,2,3\n')
+        with open('build/manifest.txt', 'w') as f:
+            f.write('# studies\nbatch/first.csv\n\nbatch/second.csv\n')
+
+        for inputs, jobs in [('build/batch', '2'), ('build/batch/*.csv', '1'), ('build/manifest.txt', '1')]:
+            shutil.rmtree('build/batchReport', ignore_errors=True)
+            main(['-b', inputs,
+                  "-s", "3,10,3",
+                  "-a", "0,2,1",
+                  "-j", jobs,
+                  "-o", 'build/batchReport'])
+            self.assertTrue(os.path.exists('build/batchReport/index.html'))
+            self.assertTrue(os.path.exists('build/batchReport/first/index.html'))
+            self.assertTrue(os.path.exists('build/batchReport/second/index.html'))
+        with open('build/batchReport/index.html') as f:
+            self.assertIn('href="first/index.html"', f.read())
+        self.assertEqual(
+            sorted(os.listdir('build/batchReport')),
+            sorted(['bootstrap.min.css', plotlyAsset(), 'index.html', 'first', 'second']))
+        with open('build/batchReport/first/index.html') as f:
+            self.assertIn('href="../bootstrap.min.css"', f.read())
+        with open('build/batchReport/second/Parts Box Plot.html') as f:
+            self.assertIn('src="../' + plotlyAsset() + '"', f.read())
+
+    def test_StudyOptions(self):
+        sizes = []
+        for count in [1, 1000]:
+            app = Application(['-b', 'build/batch', '-s', '3,10,3', '-j', '2'])
+            app.files = ['build/batch/study%d.csv' % i for i in range(count)]
+            options = app.studyOptions()
+            self.assertIsNone(options.files)
+            self.assertIsNone(options.jobs)
+            sizes.append(len(pickle.dumps(options)))
+        self.assertEqual(sizes[0], sizes[1])
+
+    def test_RunStudy(self):
+        studies = [
+            (['-b', 'data', '-s', '3,10,3', '-a', '0,2,1'], "data/data_demoGRnR.csv"),
+            (['-b', 'data', '-w'], "data/data_wide.csv"),
+            (['-b', 'data', '-k', 'gauge'], "data/data_groups.csv")]
+        for argv, file in studies:
+            file, percent, error = runStudy(Application(argv).studyOptions(), file)
+            self.assertEqual(error, '')
+            self.assertEqual(percent != '', argv[-1] == '0,2,1')
+        runStudy(Application(studies[0][0]).studyOptions(), studies[0][1], 'build/runStudy')
+        self.assertTrue(os.path.exists('build/runStudy/index.html'))
+
+    def test_StudyNames(self):
+        self.assertEqual(
+            studyNames(['a/x.csv', 'b/x_2.csv', 'c/x.csv', 'd/x.csv', 'e/y.csv']),
+            ['x', 'x_2', 'x_3', 'x_4', 'y'])
+
+    def test_BatchErrors(self):
+        os.makedirs('build/batchErrors', exist_ok=True)
+        with open('build/batchErrors/broken.csv', 'w') as f:
+            f.write('1,2,3\n')
+        rows = Application(['-b', 'build/batchErrors', '-s', '3,10,3'])
+        rows.check()
+        rows = rows.run()
+        self.assertEqual(len(rows), 1)
+        self.assertNotEqual(rows[0][2], '')
+        self.assertRaises(FileNotFoundError, main, ['-b', 'build/missing*.csv', '-s', '3,10,3'])
+
+    def test_WrongDtype(self):
+        self.assertRaises(
+            AttributeError,
+            main, [
+                '-f', "data/data_demoGRnR.csv",
+                "-s", "3,10,3",
+                "-t", "int8"])
 
     def test_FailToGenerateReport(self):
         forbiddenFolders = {'nt': "COM1", 'posix': "/build"}
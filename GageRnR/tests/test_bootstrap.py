@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""The Bootstrap Tests."""
+import unittest
+from GageRnR import Bootstrap, GageRnR, Component, Result
+from .data import data
+import numpy as np
+
+
+class TestBootstrap(unittest.TestCase):
+    """The Bootstrap Tests."""
+
+    def test_intervalContainsEstimate(self):
+        b = Bootstrap(data, replicates=2000, seed=1)
+        b.calculate()
+        g = GageRnR(data)
+        g.calculate()
+
+        for result in [Result.Var, Result.Percent]:
+            for key in [Component.PART, Component.MEASUREMENT, GageRnR.GRR]:
+                lower, upper = b.result[result][key]
+                self.assertLessEqual(lower, upper)
+                self.assertLessEqual(lower, g.result[result][key])
+                self.assertGreaterEqual(upper, g.result[result][key])
+
+    def test_seed(self):
+        first = Bootstrap(data, replicates=500, seed=3).calculate()
+        second = Bootstrap(data, replicates=500, seed=3).calculate()
+        np.testing.assert_array_equal(
+            first[Result.Percent][GageRnR.GRR],
+            second[Result.Percent][GageRnR.GRR])
+
+    def test_resampleOperators(self):
+        b = Bootstrap(data, replicates=10, resample=(Component.OPERATOR,), seed=2)
+        operatorIndex, partIndex = b.createIndices()
+        self.assertEqual(operatorIndex.shape, (10, 3))
+        np.testing.assert_array_equal(partIndex, np.tile(np.arange(5), (10, 1)))
+
+    def test_replicatesMatchGageRnR(self):
+        b = Bootstrap(data, replicates=4, resample=(Component.OPERATOR, Component.PART), seed=4)
+        operatorIndex, partIndex = b.createIndices()
+        samples = b.calculateSamples()
+
+        for i in range(4):
+            resampled = data[operatorIndex[i][:, np.newaxis], partIndex[i]]
+            g = GageRnR(resampled)
+            g.calculate()
+            np.testing.assert_allclose(
+                samples[Result.Var][GageRnR.GRR][i],
+                g.result[Result.Var][GageRnR.GRR])
+
+    def test_processes(self):
+        serial = Bootstrap(data, replicates=10000, seed=5).calculate()
+        parallel = Bootstrap(data, replicates=10000, seed=5, processes=2).calculate()
+        np.testing.assert_allclose(
+            serial[Result.Var][GageRnR.GRR],
+            parallel[Result.Var][GageRnR.GRR])
+
+    def test_summaryException(self):
+        b = Bootstrap(data)
+        self.assertRaises(Exception, b.summary)
+
+    def test_summary(self):
+        b = Bootstrap(data, replicates=100)
+        b.calculate()
+        b.summary()
+        self.assertTrue(True)
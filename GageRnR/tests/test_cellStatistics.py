@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""The CellStatistics Tests."""
+import pickle
+import unittest
+from GageRnR import GageRnR, Statistics, CellStatistics, Component, Result
+from .data import data
+import numpy as np
+
+
+def readings(values):
+    """Flatten data to operator, part and value readings."""
+    operator, part, _ = np.indices(values.shape)
+    return operator.ravel(), part.ravel(), values.ravel()
+
+
+class TestCellStatistics(unittest.TestCase):
+    """The CellStatistics Tests."""
+
+    def assertResultEqual(self, result, expected):
+        for key in expected:
+            for comp in expected[key]:
+                np.testing.assert_allclose(
+                    result[key][comp], expected[key][comp],
+                    rtol=1e-9, atol=1e-12)
+
+    def test_zeros(self):
+        cells = CellStatistics.zeros(3, 5)
+        self.assertEqual(cells.shape, (3, 5, 0))
+        np.testing.assert_array_equal(cells.counts, np.zeros((3, 5)))
+
+    def test_addSingleReadings(self):
+        cells = CellStatistics.zeros(3, 5)
+        for operator, part, value in zip(*readings(data)):
+            cells.add(operator, part, value)
+
+        expected = CellStatistics.fromData(data)
+        self.assertEqual(cells.shape, (3, 5, 3))
+        np.testing.assert_array_equal(cells.counts, expected.counts)
+        np.testing.assert_allclose(cells.means, expected.means)
+        np.testing.assert_allclose(cells.m2, expected.m2)
+
+    def test_addChunks(self):
+        operator, part, value = readings(data)
+        order = np.random.default_rng(1).permutation(value.size)
+        cells = CellStatistics.zeros(3, 5)
+        for chunk in np.array_split(order, 4):
+            cells.add(operator[chunk], part[chunk], value[chunk])
+
+        g = GageRnR(cells)
+        g.calculate()
+        expected = GageRnR(data)
+        expected.calculate()
+        self.assertResultEqual(g.result, expected.result)
+        g.summary()
+
+    def test_addLargeOffset(self):
+        offset = 1e9
+        cells = CellStatistics.zeros(3, 5)
+        cells.add(*readings(data + offset))
+        single = CellStatistics.zeros(3, 5)
+        for operator, part, value in zip(*readings(data + offset)):
+            single.add(operator, part, value)
+
+        expected = CellStatistics.fromData(data)
+        np.testing.assert_allclose(cells.m2, expected.m2, rtol=1e-6)
+        # The running mean of a single reading is rounded to the data.
+        np.testing.assert_allclose(single.m2, expected.m2, rtol=1e-6, atol=np.spacing(offset))
+
+    def test_addOutOfBounds(self):
+        cells = CellStatistics.zeros(3, 5)
+        self.assertRaises(ValueError, cells.add, 3, 0, 1.0)
+        self.assertRaises(ValueError, cells.add, [0, 3], [0, 0], [1.0, 1.0])
+        np.testing.assert_array_equal(cells.counts, np.zeros((3, 5)))
+
+    def test_resultAtAnyMoment(self):
+        operator, part, value = readings(data)
+        # Stream every cell's first two measurements, then the third one
+        # of a few cells at a time so intermediate studies are unbalanced.
+        order = np.argsort(np.indices(data.shape)[2].ravel(), kind='stable')
+        cells = CellStatistics.zeros(3, 5)
+        seen = np.full(data.size, np.nan)
+        for chunk in np.split(order, [30, 34, 41]):
+            cells.add(operator[chunk], part[chunk], value[chunk])
+            seen[chunk] = value[chunk]
+            g = GageRnR(cells)
+            g.calculate()
+            expected = GageRnR(seen.reshape(data.shape))
+            expected.calculate()
+
+            present = seen[~np.isnan(seen)]
+            within = seen.reshape(data.shape)
+            within = np.nansum((within - np.nanmean(within, axis=2, keepdims=True))**2)
+            self.assertEqual(g.result[Result.DF][Component.TOTAL], present.size - 1)
+            self.assertEqual(g.result[Result.DF][Component.MEASUREMENT], present.size - 15)
+            self.assertAlmostEqual(g.result[Result.SS][Component.MEASUREMENT], within)
+            counts = np.sum(~np.isnan(seen.reshape(data.shape)), axis=2)
+            MS = g.result[Result.MS]
+            self.assertAlmostEqual(
+                g.result[Result.Var][Component.PART],
+                (MS[Component.PART] - MS[Component.OPERATOR_BY_PART]) /
+                (3 * 15 / np.sum(1 / counts)))
+            for key in [Result.DF, Result.SS, Result.MS, Result.Var]:
+                for comp in expected.result[key]:
+                    np.testing.assert_allclose(
+                        g.result[key][comp], expected.result[key][comp],
+                        rtol=1e-9, atol=1e-12)
+
+        self.assertAlmostEqual(
+            g.result[Result.Var][Component.PART], 0.8021, 3)
+
+    def test_merge(self):
+        shards = [CellStatistics.fromData(data[:, :, i:i + 1]) for i in range(3)]
+        merged = shards[2].merge(shards[0]).merge(shards[1])
+
+        g = GageRnR(merged)
+        g.calculate()
+        expected = GageRnR(data)
+        expected.calculate()
+        self.assertResultEqual(g.result, expected.result)
+
+    def test_mergeAssociative(self):
+        operator, part, value = readings(data)
+        shards = []
+        for chunk in np.array_split(np.arange(value.size), 5):
+            shard = CellStatistics.zeros(3, 5)
+            shards.append(shard.add(operator[chunk], part[chunk], value[chunk]))
+
+        left = (((shards[0] + shards[1]) + shards[2]) + shards[3]) + shards[4]
+        right = shards[0] + (shards[1] + (shards[2] + (shards[3] + shards[4])))
+        np.testing.assert_array_equal(left.counts, right.counts)
+        np.testing.assert_allclose(left.means, right.means)
+        np.testing.assert_allclose(left.m2, right.m2)
+        np.testing.assert_allclose(left.m2, CellStatistics.fromData(data).m2)
+
+    def test_mergeBatch(self):
+        studies = np.stack([data, 2 * data])
+        merged = CellStatistics.fromData(studies[..., :2]).merge(
+            CellStatistics.fromData(studies[..., 2:]))
+
+        g = GageRnR(merged)
+        g.calculate()
+        expected = GageRnR(studies)
+        expected.calculate()
+        self.assertResultEqual(g.result, expected.result)
+
+    def test_mergeShapeError(self):
+        self.assertRaises(
+            AttributeError,
+            CellStatistics.zeros(3, 5).merge,
+            CellStatistics.zeros(3, 4))
+
+    def test_pickle(self):
+        cells = CellStatistics.fromData(data)
+        loaded = pickle.loads(pickle.dumps(cells))
+        np.testing.assert_array_equal(loaded.m2, cells.m2)
+        self.assertEqual(loaded.shape, cells.shape)
+
+    def test_statistics(self):
+        s = Statistics(CellStatistics.fromData(data))
+        s.calculate()
+        expected = Statistics(data)
+        expected.calculate()
+        self.assertResultEqual(s.result, expected.result)
+
+    def test_scale(self):
+        cells = CellStatistics.fromData(data).scale(2.5)
+        expected = CellStatistics.fromData(2.5 * data)
+        np.testing.assert_allclose(cells.means, expected.means)
+        np.testing.assert_allclose(cells.m2, expected.m2)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""The confidence interval Tests."""
+import unittest
+from GageRnR import GageRnR, Component, Result
+from GageRnR.confidence import mlsInterval, satterthwaiteInterval
+from .data import data
+import numpy as np
+import scipy.stats as stats
+
+
+def simulate(studies, operators, parts, measurements, sigma, seed):
+    """Simulate studies with known variance components."""
+    rng = np.random.default_rng(seed)
+    return (
+        rng.normal(0, sigma[Component.OPERATOR], (studies, operators, 1, 1)) +
+        rng.normal(0, sigma[Component.PART], (studies, 1, parts, 1)) +
+        rng.normal(0, sigma[Component.OPERATOR_BY_PART], (studies, operators, parts, 1)) +
+        rng.normal(0, sigma[Component.MEASUREMENT], (studies, operators, parts, measurements)))
+
+
+class TestConfidence(unittest.TestCase):
+    """The confidence interval Tests."""
+
+    def test_measurementIsChiSquare(self):
+        g = GageRnR(data)
+        g.calculate()
+        CI = g.calculateConfidence(alpha=0.1)
+
+        MS = g.result[Result.MS][Component.MEASUREMENT]
+        DoF = g.result[Result.DF][Component.MEASUREMENT]
+        np.testing.assert_allclose(
+            CI[Component.MEASUREMENT],
+            [DoF * MS / stats.chi2.isf(0.05, DoF),
+             DoF * MS / stats.chi2.ppf(0.05, DoF)])
+
+    def test_intervalContainsEstimate(self):
+        sigma = {
+            Component.OPERATOR: 0.5,
+            Component.PART: 2,
+            Component.OPERATOR_BY_PART: 1,
+            Component.MEASUREMENT: 1}
+        for studies in [data, simulate(200, 3, 10, 3, sigma, seed=5)]:
+            g = GageRnR(studies)
+            g.calculate()
+            for method in ['MLS', 'Satterthwaite']:
+                CI = g.calculateConfidence(method=method)
+                for key in [
+                        Component.PART,
+                        Component.OPERATOR_BY_PART,
+                        Component.MEASUREMENT,
+                        Component.TOTAL,
+                        GageRnR.GRR]:
+                    lower, upper = np.moveaxis(CI[key], -1, 0)
+                    self.assertTrue(np.all(lower <= g.result[Result.Var][key]))
+                    self.assertTrue(np.all(upper >= g.result[Result.Var][key]))
+
+    def test_coverage(self):
+        sigma = {
+            Component.OPERATOR: 0.5,
+            Component.PART: 2,
+            Component.OPERATOR_BY_PART: 0.3,
+            Component.MEASUREMENT: 1}
+        g = GageRnR(simulate(2000, 3, 10, 3, sigma, seed=7))
+        g.calculate()
+        CI = g.calculateConfidence()
+
+        truth = {key: sigma[key]**2 for key in sigma}
+        truth[GageRnR.GRR] = \
+            truth[Component.OPERATOR] + \
+            truth[Component.OPERATOR_BY_PART] + \
+            truth[Component.MEASUREMENT]
+        for key in truth:
+            self.assertEqual(CI[key].shape, (2000, 2))
+            covered = np.mean((CI[key][:, 0] <= truth[key]) & (truth[key] <= CI[key][:, 1]))
+            self.assertGreater(covered, 0.93)
+
+    def test_satterthwaiteNonPositive(self):
+        interval = satterthwaiteInterval(
+            {Component.OPERATOR: 1, Component.MEASUREMENT: -1},
+            {Component.OPERATOR: np.array([1.0, 2.0]), Component.MEASUREMENT: np.array([1.5, 1.0])},
+            {Component.OPERATOR: 4, Component.MEASUREMENT: 30})
+        np.testing.assert_array_equal(interval[0], [0, 0])
+        self.assertGreater(interval[1, 1], 1)
+
+    def test_mlsNegativeCoefficients(self):
+        self.assertRaises(
+            AttributeError,
+            mlsInterval,
+            {Component.OPERATOR: 1, Component.PART: -1, Component.MEASUREMENT: -1},
+            {Component.OPERATOR: 1, Component.PART: 1, Component.MEASUREMENT: 1},
+            {Component.OPERATOR: 1, Component.PART: 1, Component.MEASUREMENT: 1})
+
+    def test_methodError(self):
+        g = GageRnR(data)
+        g.calculate()
+        self.assertRaises(AttributeError, g.calculateConfidence, method='Bootstrap')
+
+    def test_calculateException(self):
+        g = GageRnR(data)
+        self.assertRaises(Exception, g.calculateConfidence)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+from GageRnR import DataCache
+import numpy as np
+
+
+class TestDataCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = os.path.join(self.directory.name, 'cache')
+        self.file = os.path.join(self.directory.name, 'data.csv')
+        with open(self.file, 'w') as f:
+            f.write('1,2,3\n')
+        self.options = {'structure': [1, 1, 3], 'multiply': 1.0}
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load(self):
+        cache = DataCache(self.folder)
+        load = Mock(return_value=np.arange(3.0))
+        first = cache.load(self.file, self.options, load)
+        second = cache.load(self.file, self.options, load)
+        load.assert_called_once()
+        np.testing.assert_array_equal(first, second)
+        self.assertFalse(second.flags.writeable)
+
+    def test_options(self):
+        cache = DataCache(self.folder)
+        cache.put(self.file, self.options, np.arange(3.0))
+        self.assertIsNotNone(cache.get(self.file, self.options))
+        self.assertIsNone(cache.get(self.file, {'structure': [1, 1, 3], 'multiply': 2.0}))
+
+    def test_modified(self):
+        cache = DataCache(self.folder)
+        cache.put(self.file, self.options, np.arange(3.0))
+        stat = os.stat(self.file)
+        os.utime(self.file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertIsNone(cache.get(self.file, self.options))
+
+    def test_evict(self):
+        cache = DataCache(self.folder, maxBytes=2000)
+        for i in range(2):
+            cache.put(self.file, {'index': i}, np.zeros(100))
+            os.utime(cache.path(cache.key(self.file, {'index': i})), (i, i))
+        cache.get(self.file, {'index': 0})
+        cache.put(self.file, {'index': 2}, np.zeros(100))
+        self.assertLessEqual(cache.size(), 2000)
+        self.assertIsNotNone(cache.get(self.file, {'index': 0}))
+        self.assertIsNotNone(cache.get(self.file, {'index': 2}))
+        self.assertIsNone(cache.get(self.file, {'index': 1}))
+
+    def test_keepLargeEntry(self):
+        cache = DataCache(self.folder, maxBytes=10)
+        cache.put(self.file, self.options, np.zeros(100))
+        self.assertIsNotNone(cache.get(self.file, self.options))
+
+    def test_missingFolder(self):
+        cache = DataCache(self.folder)
+        self.assertEqual(cache.entries(), [])
+        self.assertEqual(cache.size(), 0)
+        self.assertIsNone(cache.get(self.file, self.options))
+
+    def test_removedConcurrently(self):
+        cache = DataCache(self.folder, maxBytes=10)
+        cache.put(self.file, {'index': 0}, np.zeros(100))
+        path = cache.path(cache.key(self.file, {'index': 0}))
+        # Entries removed by another process after being listed.
+        listdir = os.listdir
+        with patch('os.listdir', side_effect=lambda folder: listdir(folder) + ['removed.npy', 'removed.npy.tmp']):
+            self.assertEqual(cache.entries(), [path])
+        with patch('os.remove', side_effect=FileNotFoundError):
+            cache.put(self.file, {'index': 1}, np.zeros(100))
+        with patch('os.utime', side_effect=FileNotFoundError):
+            self.assertIsNone(cache.get(self.file, {'index': 1}))
+        os.remove(path)
+        self.assertEqual(cache.size(), os.path.getsize(cache.path(cache.key(self.file, {'index': 1}))))
+        with patch('os.path.getsize', side_effect=FileNotFoundError):
+            self.assertEqual(cache.size(), 0)
@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
+import os.path
+import tempfile
 import unittest
-from GageRnR import DataLoader
+from unittest.mock import patch
+from GageRnR import DataLoader, CellStatistics, GageRnR
+from GageRnR.dataLoader import factorize
+import numpy as np
 
 
 class TestDataLoader(unittest.TestCase):
@@ -14,3 +19,251 @@ class TestDataLoader(unittest.TestCase):
             axes=[0, 2, 1],
             delimiter=',')
         self.assertEqual(data.shape, (3, 10, 3))
+
+    def test_LoadFloat32(self):
+
+        loader = DataLoader()
+        arguments = dict(
+            file="data/data_demoGRnR.csv",
+            structure=[3, 10, 3],
+            axes=[0, 2, 1],
+            delimiter=',')
+        data = loader.load(**arguments)
+        single = loader.load(dtype=np.float32, **arguments)
+        self.assertEqual(single.dtype, np.float32)
+        np.testing.assert_array_equal(single, data.astype(np.float32))
+        cells = loader.loadCells(memoryLimit=1000, dtype=np.float32, **arguments)
+        np.testing.assert_allclose(cells.means, CellStatistics.fromData(single).means)
+
+    def test_Parse(self):
+
+        loader = DataLoader()
+        expected = np.loadtxt("data/data_opXm.csv", delimiter=',').ravel()
+        for engine in ['pandas', 'numpy']:
+            for threads in [None, 2]:
+                values = loader.parse(
+                    "data/data_opXm.csv", ',', engine=engine, threads=threads, blockBytes=1000)
+                np.testing.assert_array_equal(values, expected)
+
+        with tempfile.TemporaryDirectory() as folder:
+            file = os.path.join(folder, 'data.csv')
+            expected = np.random.default_rng(0).normal(100, 3, (100, 30))
+            np.savetxt(file, expected, delimiter=',', fmt='%.17g')
+            for engine in ['pandas', 'numpy']:
+                np.testing.assert_array_equal(
+                    loader.parse(file, ',', engine=engine), expected.ravel())
+
+    def test_ParseComments(self):
+
+        loader = DataLoader()
+        with tempfile.TemporaryDirectory() as folder:
+            file = os.path.join(folder, 'data.csv')
+            with open(file, 'w') as f:
+                f.write('# m1, m2\n1.5, 2\n\n3, 4  # p2\n# end\n5, 6')
+            for engine in ['pandas', 'numpy']:
+                np.testing.assert_array_equal(
+                    loader.parse(file, ',', engine=engine, blockBytes=8),
+                    [1.5, 2, 3, 4, 5, 6])
+
+            with open(file, 'w') as f:
+                f.write('# empty\n')
+            for engine in ['pandas', 'numpy']:
+                self.assertEqual(loader.parse(file, ',', engine=engine).size, 0)
+
+    def test_ParseMalformed(self):
+
+        loader = DataLoader()
+        with tempfile.TemporaryDirectory() as folder:
+            file = os.path.join(folder, 'data.csv')
+            for text in ['1,2,3\n4,5\n7,8,9\n', '1,2,3\n4,,6\n', '1,2\n3,4,5\n', '1,2,3\n4,a,6\n']:
+                with open(file, 'w') as f:
+                    f.write(text)
+                for engine in ['pandas', 'numpy']:
+                    for blockBytes in [4, 1000]:
+                        self.assertRaises(
+                            ValueError, loader.parse, file, ',', engine=engine, blockBytes=blockBytes)
+
+            with open(file, 'w') as f:
+                f.write('1,2,3\n4,nan,6\n')
+            for engine in ['pandas', 'numpy']:
+                np.testing.assert_array_equal(
+                    loader.parse(file, ',', engine=engine), [1, 2, 3, 4, np.nan, 6])
+
+    def test_ParseEngineError(self):
+
+        loader = DataLoader()
+        self.assertRaises(
+            AttributeError, loader.parse, "data/data_opXm.csv", ',', engine='csv')
+
+    def writeTidy(self, folder, data, order):
+        file = os.path.join(folder, 'tidy.csv')
+        operator, part, measurement = np.unravel_index(order, data.shape)
+        with open(file, 'w') as f:
+            f.write('operator,part,replicate,value\n')
+            for o, p, m in zip(operator, part, measurement):
+                f.write('op%d,P-%d,%d,%r\n' % (o, p, m + 1, float(data[o, p, m])))
+        return file
+
+    def test_LoadTidy(self):
+
+        loader = DataLoader()
+        data = np.round(np.random.default_rng(0).normal(size=(3, 4, 2)), 3)
+        order = np.random.default_rng(1).permutation(data.size)
+        with tempfile.TemporaryDirectory() as folder:
+            file = self.writeTidy(folder, data, order)
+            for engine in ['pandas', 'numpy']:
+                tidy, labels = loader.loadTidy(file, skiprows=1, engine=engine)
+                operators = [int(label[2:]) for label in labels['Operator']]
+                parts = [int(label[2:]) for label in labels['Part']]
+                np.testing.assert_array_equal(tidy, data[operators][:, parts])
+                self.assertEqual(sorted(labels['Operator']), ['op0', 'op1', 'op2'])
+
+                tidy, labels = loader.loadTidy(
+                    file, skiprows=1, columns=(0, 1, None, 3), engine=engine)
+                operators = [int(label[2:]) for label in labels['Operator']]
+                parts = [int(label[2:]) for label in labels['Part']]
+                np.testing.assert_array_equal(
+                    np.sort(tidy, axis=-1), np.sort(data[operators][:, parts], axis=-1))
+
+    def test_LoadTidyReplicates(self):
+
+        loader = DataLoader()
+        data = np.arange(48.0).reshape(2, 2, 12)
+        order = np.random.default_rng(3).permutation(data.size)
+        with tempfile.TemporaryDirectory() as folder:
+            file = self.writeTidy(folder, data, order)
+            for engine in ['pandas', 'numpy']:
+                tidy, labels = loader.loadTidy(file, skiprows=1, engine=engine)
+                operators = [int(label[2:]) for label in labels['Operator']]
+                parts = [int(label[2:]) for label in labels['Part']]
+                np.testing.assert_array_equal(tidy, data[operators][:, parts])
+
+    def test_LoadTidyMissing(self):
+
+        loader = DataLoader()
+        data = np.arange(12.0).reshape(2, 3, 2)
+        with tempfile.TemporaryDirectory() as folder:
+            file = self.writeTidy(folder, data, np.arange(data.size - 1))
+            for engine in ['pandas', 'numpy']:
+                tidy, labels = loader.loadTidy(file, skiprows=1, engine=engine)
+                self.assertEqual(labels['Part'], ['P-0', 'P-1', 'P-2'])
+                self.assertTrue(np.isnan(tidy[1, 2, 1]))
+                np.testing.assert_array_equal(tidy.ravel()[:-1], data.ravel()[:-1])
+
+            file = self.writeTidy(folder, data, np.array([0, 1, 1]))
+            self.assertRaises(ValueError, loader.loadTidy, file, skiprows=1)
+            self.assertRaises(AttributeError, loader.loadTidy, file, engine='csv')
+
+    def test_Factorize(self):
+
+        labels = np.array(['b', 'a', 'c', 'a', 'b'], dtype=object)
+        for pandas in [True, False]:
+            with patch('importlib.util.find_spec', return_value=pandas or None):
+                unique, codes = factorize(labels)
+                self.assertEqual(list(unique), ['b', 'a', 'c'])
+                np.testing.assert_array_equal(codes, [0, 1, 2, 1, 0])
+                unique, codes = factorize(labels, sort=True)
+                self.assertEqual(list(unique), ['a', 'b', 'c'])
+                np.testing.assert_array_equal(codes, [1, 0, 2, 0, 1])
+                unique, codes = factorize(np.array(['10', '2', '1', '2'], dtype=object), sort=True)
+                self.assertEqual(list(unique), ['1', '2', '10'])
+                np.testing.assert_array_equal(codes, [2, 1, 0, 1])
+
+    def test_LoadTidyLabels(self):
+
+        loader = DataLoader()
+        data = np.round(np.random.default_rng(2).normal(size=(2, 3, 2)), 3)
+        with tempfile.TemporaryDirectory() as folder:
+            file = self.writeTidy(folder, data, np.arange(data.size))
+            tidy, labels = loader.loadTidy(file, skiprows=1)
+        g = GageRnR(tidy, labels)
+        self.assertEqual(g.labels['Operator'], ['op0', 'op1'])
+        self.assertEqual(g.labels['Part'], ['P-0', 'P-1', 'P-2'])
+
+    def test_LoadWide(self):
+
+        loader = DataLoader()
+        demo = loader.load("data/data_demoGRnR.csv", [3, 10, 3], [0, 2, 1], ',')
+        for engine in ['pandas', 'numpy']:
+            data, labels = loader.loadWide("data/data_wide.csv", engine=engine)
+            self.assertEqual(data.shape, (2, 3, 10, 3))
+            self.assertEqual(labels['Characteristic'], ['height', 'diameter'])
+            self.assertEqual(labels['Operator'], ['A', 'B', 'C'])
+            np.testing.assert_array_equal(data[0], demo)
+
+            single, _ = loader.loadWide(
+                "data/data_wide.csv", characteristics=['diameter'], engine=engine)
+            np.testing.assert_array_equal(single, data[1:])
+            tidy, _ = loader.loadTidy(
+                "data/data_wide.csv", columns=(0, 1, 2, 4), skiprows=1, engine=engine)
+            np.testing.assert_array_equal(tidy, data[1])
+
+    def test_LoadBinary(self):
+
+        loader = DataLoader()
+        arguments = dict(structure=[3, 10, 3], axes=[0, 2, 1], delimiter=',')
+        data = loader.load(file="data/data_demoGRnR.csv", **arguments)
+        raw = np.loadtxt("data/data_demoGRnR.csv", delimiter=',')
+        with tempfile.TemporaryDirectory() as folder:
+            npy = os.path.join(folder, 'data.npy')
+            np.save(npy, raw)
+            mapped = loader.load(file=npy, **arguments)
+            self.assertFalse(mapped.flags.writeable)
+            self.assertIsInstance(mapped.base, np.memmap)
+            np.testing.assert_array_equal(mapped, data)
+
+            binary = os.path.join(folder, 'data.raw')
+            raw.astype(np.float32).tofile(binary)
+            mapped = loader.load(file=binary, dtype=np.float32, **arguments)
+            self.assertEqual(mapped.dtype, np.float32)
+            np.testing.assert_array_equal(mapped, data.astype(np.float32))
+
+            cells = loader.loadCells(file=npy, **arguments)
+            np.testing.assert_allclose(cells.m2, CellStatistics.fromData(data).m2)
+            del mapped
+
+    def test_LoadBinarySizeError(self):
+
+        loader = DataLoader()
+        with tempfile.TemporaryDirectory() as folder:
+            binary = os.path.join(folder, 'data.bin')
+            np.zeros(10).tofile(binary)
+            npy = os.path.join(folder, 'data.npy')
+            np.save(npy, np.zeros(10))
+            for file, message in [(binary, '80 bytes'), (npy, '10 values')]:
+                with self.assertRaises(ValueError) as context:
+                    loader.load(file=file, structure=[3, 10, 3], axes=[0, 1, 2], delimiter=',')
+                self.assertIn(message, str(context.exception))
+
+    def test_LoadCells(self):
+
+        loader = DataLoader()
+        for file, structure, axes in [
+                ("data/data_demoGRnR.csv", [3, 10, 3], [0, 2, 1]),
+                ("data/data_opXm.csv", [5, 7, 11], [2, 1, 0])]:
+            data = loader.load(
+                file=file,
+                structure=structure,
+                axes=axes,
+                delimiter=',')
+            cells = loader.loadCells(
+                file=file,
+                structure=structure,
+                axes=axes,
+                delimiter=',',
+                memoryLimit=1000)
+            expected = CellStatistics.fromData(data)
+            np.testing.assert_array_equal(cells.counts, expected.counts)
+            np.testing.assert_allclose(cells.means, expected.means)
+            np.testing.assert_allclose(cells.m2, expected.m2)
+
+    def test_LoadCellsStructureError(self):
+
+        loader = DataLoader()
+        self.assertRaises(
+            ValueError,
+            loader.loadCells,
+            file="data/data_demoGRnR.csv",
+            structure=[3, 10, 2],
+            axes=[0, 2, 1],
+            delimiter=',')
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""The Dataset Tests."""
+import unittest
+from GageRnR import Dataset, GageRnR, Statistics, Normality, Linearity
+from GageRnR import CellStatistics, Component, Result
+from .data import data
+import numpy as np
+
+
+class TestDataset(unittest.TestCase):
+    """The Dataset Tests."""
+
+    def test_memoized(self):
+        d = Dataset(data)
+        self.assertIs(d.mean(), d.mean())
+        self.assertIs(d.std(), d.std())
+        self.assertIs(d.parts(), d.parts())
+        self.assertIs(d.cells(), d.cells())
+        self.assertEqual(d.shape, (3, 5, 3))
+
+    def test_shared(self):
+        d = Dataset(data)
+        g = GageRnR(d)
+        g.calculate()
+        s = Statistics(d)
+        s.calculate()
+        n = Normality(d)
+        n.calculate()
+        lin = Linearity(d)
+        lin.calculate()
+
+        self.assertIs(g.result[Result.Mean], s.result[Result.Mean])
+        self.assertIs(lin.gt, d.mean()[Component.PART])
+        self.assertIs(lin.dataToParts(), s.dataToParts())
+        operators = s.dataToOperators()
+        self.assertEqual(operators.shape, (3, 15))
+        self.assertTrue(np.shares_memory(operators, data))
+        np.testing.assert_array_equal(operators[1], data[1].ravel())
+        self.assertIs(n.data, data)
+
+    def test_mean(self):
+        mean = Dataset(data).mean()
+        np.testing.assert_allclose(mean[Component.TOTAL], [np.mean(data)])
+        np.testing.assert_allclose(mean[Component.OPERATOR], np.mean(data, axis=(1, 2)))
+        np.testing.assert_allclose(mean[Component.PART], np.mean(data, axis=(0, 2)))
+        np.testing.assert_allclose(
+            mean[Component.MEASUREMENT], np.mean(data, axis=2).reshape(-1))
+
+    def test_cells(self):
+        cells = Dataset(data).cells()
+        expected = CellStatistics.fromData(data)
+        np.testing.assert_allclose(cells.means, expected.means)
+        np.testing.assert_allclose(cells.m2, expected.m2)
+
+    def test_reduced(self):
+        cells = CellStatistics.fromData(data)
+        d = Dataset(cells)
+        self.assertTrue(d.isReduced())
+        self.assertIs(d.cells(), cells)
+        np.testing.assert_allclose(
+            d.std()[Component.PART], Dataset(data).std()[Component.PART])
+
+    def test_float32(self):
+        single = (data + 1000).astype(np.float32)
+        d = Dataset(single)
+        self.assertEqual(d.parts().dtype, np.float32)
+        self.assertEqual(d.cells().means.dtype, np.float64)
+        g = GageRnR(d)
+        g.calculate()
+        # Accumulated in double precision only the input rounding remains.
+        double = GageRnR(single.astype(np.float64))
+        double.calculate()
+        for result in [Result.SS, Result.Var]:
+            for key in double.result[result]:
+                np.testing.assert_allclose(
+                    g.result[result][key], double.result[result][key], rtol=1e-12)
+        np.testing.assert_allclose(
+            d.std()[Component.PART], Dataset(single.astype(np.float64)).std()[Component.PART], rtol=1e-12)
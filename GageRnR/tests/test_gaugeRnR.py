@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """The GageRnR Tests."""
 import unittest
-from GageRnR import GageRnR, Component, Result
+from unittest.mock import Mock
+from GageRnR import GageRnR, CellStatistics, Component, Result
 from .data import data, squaresMeas
 import numpy as np
 
@@ -183,3 +184,155 @@ class TestGageRnR(unittest.TestCase):
         g.calculate()
         g.summary()
         self.assertTrue(True)
+
+    def test_batchShape(self):
+        """The GageRnR Tests."""
+        g = GageRnR(np.stack([data, data, data, data]))
+        self.assertEqual(g.batch, (4,))
+        self.assertEqual(g.operators, 3)
+        self.assertEqual(g.parts, 5)
+        self.assertEqual(g.measurements, 3)
+
+    def test_batchCalculate(self):
+        """The GageRnR Tests."""
+        studies = np.stack([data, 2 * data, data[:, ::-1, :]])
+        g = GageRnR(studies)
+        g.calculate()
+
+        for i in range(studies.shape[0]):
+            single = GageRnR(studies[i])
+            single.calculate()
+            for key in single.result:
+                for comp in single.result[key]:
+                    self.assertEqual(len(g.result[key][comp]), 3)
+                    np.testing.assert_allclose(
+                        g.result[key][comp][i],
+                        single.result[key][comp])
+
+    def test_batchSummary(self):
+        """The GageRnR Tests."""
+        g = GageRnR(np.stack([data, 2 * data]))
+        g.calculate()
+        self.assertRaises(Exception, g.summary)
+        single = GageRnR(2 * data)
+        single.calculate()
+        self.assertEqual(g.summary(study=1), single.summary())
+        g.__str__()
+
+    def test_calculateSSMatchesSquares(self):
+        """The GageRnR Tests."""
+        rng = np.random.default_rng(3)
+        for sample in [data, np.stack([data, 3 * data]), rng.normal(10, 2, (4, 2000, 5))]:
+            g = GageRnR(sample)
+            SS = g.calculateSS()
+            reference = g.calculateSumOfSquares()
+            for comp in Component:
+                np.testing.assert_allclose(SS[comp], reference[comp], rtol=1e-10)
+
+    def test_calculateCellsBlocks(self):
+        """The GageRnR Tests."""
+        g = GageRnR(data)
+        cells = g.calculateCells()
+        blocked = CellStatistics.fromData(data, blockSize=1)
+        np.testing.assert_allclose(cells.m2, blocked.m2)
+        np.testing.assert_array_equal(cells.counts, np.full((3, 5), 3))
+        np.testing.assert_allclose(
+            cells.m2.reshape(-1), np.sum(squaresMeas, axis=1), atol=2e-3)
+
+    def test_calculatePercent(self):
+        """The GageRnR Tests."""
+        g = GageRnR(data)
+        g.calculate()
+        Percent = g.result[Result.Percent]
+
+        self.assertAlmostEqual(
+            Percent[Component.TOTAL], 100, 3)
+        self.assertAlmostEqual(
+            Percent[GageRnR.GRR], 34.848, 2)
+        self.assertAlmostEqual(
+            Percent[Component.PART], 93.732, 2)
+
+    def test_missingColumn(self):
+        """The GageRnR Tests."""
+        padded = np.concatenate([data, np.full((3, 5, 1), np.nan)], axis=2)
+        g = GageRnR(padded)
+        g.calculate()
+        expected = GageRnR(data)
+        expected.calculate()
+        for key in expected.result:
+            for comp in expected.result[key]:
+                np.testing.assert_allclose(
+                    g.result[key][comp], expected.result[key][comp], rtol=1e-10)
+
+    def test_missingMeasurements(self):
+        """The GageRnR Tests."""
+        missing = data.copy()
+        missing[0, 0, 0] = np.nan
+        missing[2, 4, 1] = np.nan
+        g = GageRnR(missing)
+        g.calculate()
+
+        self.assertEqual(g.result[Result.DF][Component.MEASUREMENT], 28)
+        self.assertEqual(g.result[Result.DF][Component.TOTAL], 42)
+        within = np.nansum((missing - np.nanmean(missing, axis=2, keepdims=True))**2)
+        self.assertAlmostEqual(g.result[Result.SS][Component.MEASUREMENT], within)
+        self.assertAlmostEqual(g.calculateMeasurements(), 15 / (13 / 3 + 2 / 2))
+        for key in g.result:
+            for comp in g.result[key]:
+                self.assertTrue(np.all(np.isfinite(g.result[key][comp])))
+
+    def test_missingBatch(self):
+        """The GageRnR Tests."""
+        missing = np.stack([data, data])
+        missing[1, 1, 2, 0] = np.nan
+        g = GageRnR(missing)
+        g.calculate()
+        single = GageRnR(missing[1])
+        single.calculate()
+        np.testing.assert_array_equal(g.result[Result.DF][Component.MEASUREMENT], [30, 29])
+        np.testing.assert_allclose(
+            g.result[Result.Var][GageRnR.GRR][1], single.result[Result.Var][GageRnR.GRR])
+
+    def test_missingCell(self):
+        """The GageRnR Tests."""
+        missing = data.copy()
+        missing[1, 3, :] = np.nan
+        g = GageRnR(missing)
+        result = g.calculate()
+        self.assertRaises(AttributeError, lambda: result[Result.SS])
+
+    def test_lazyResult(self):
+        """The GageRnR Tests."""
+        g = GageRnR(data)
+        g.calculateP = Mock(side_effect=g.calculateP)
+        g.calculate()
+        self.assertFalse(g.result.isCalculated(Result.Var))
+        self.assertAlmostEqual(g.result[Result.Var][GageRnR.GRR], 0.1109, 4)
+        self.assertTrue(g.result.isCalculated(Result.MS))
+        self.assertFalse(g.result.isCalculated(Result.F))
+        g.calculateP.assert_not_called()
+        g.result[Result.P]
+        g.result[Result.P]
+        g.calculateP.assert_called_once()
+        self.assertEqual(set(g.result), set(Result) & set(g.result.factories))
+        self.assertTrue(repr(g.result).startswith('LazyResult({'))
+        self.assertTrue(g.result.isCalculated(Result.F))
+
+    def test_lazyResultInvalidate(self):
+        """The GageRnR Tests."""
+        g = GageRnR(data)
+        result = g.calculate()
+        before = result[Result.Var][GageRnR.GRR]
+        g.data = data * 2
+        self.assertFalse(result.isCalculated(Result.Var))
+        self.assertAlmostEqual(result[Result.Var][GageRnR.GRR], 4 * before)
+
+    def test_studySummary(self):
+        """The GageRnR Tests."""
+        g = GageRnR(np.stack([data, data * 2]))
+        self.assertRaises(Exception, g.studySummary)
+        g.calculate()
+        summary = g.studySummary(names=['first', 'second'], header='Characteristic')
+        self.assertIn('Characteristic', summary)
+        self.assertIn('second', summary)
+        self.assertEqual(summary.count('34.848'), 2)
@@ -5,6 +5,7 @@ from GageRnR import Distribution, Settings, Generator
 from GageRnR import GageRnR, Component, Result
 from math import sqrt
 from numpy.random import seed
+import numpy as np
 
 
 class TestGageRnR(unittest.TestCase):
@@ -43,3 +44,64 @@ class TestGageRnR(unittest.TestCase):
         sigmaTot = sqrt(self.sigmaOp**2 + self.sigmaP**2 + self.sigmaMeas**2 + self.sigmaPOP**2)
         sigmaEst = g.result[Result.Std][Component.TOTAL]
         self.assertLess(sigmaTot - sigmaEst, 0.1)
+
+
+class TestGeneratorSeed(unittest.TestCase):
+    """The Generator seed Tests."""
+
+    def setUp(self):
+        self.settings = Settings(
+            operators=Distribution(3, 0, 0.5),
+            parts=Distribution(7, 100, 5),
+            partOperator=Distribution(21, 0, 0.1),
+            measurements=Distribution(4, 0, 1))
+
+    def test_seed(self):
+        first = Generator(self.settings, seed=3)
+        second = Generator(self.settings, seed=3)
+        self.assertEqual(first.data.shape, (3, 7, 4))
+        np.testing.assert_array_equal(first.data, second.data)
+
+    def test_globalState(self):
+        seed(2)
+        first = Generator(self.settings)
+        seed(2)
+        second = Generator(self.settings)
+        np.testing.assert_array_equal(first.data, second.data)
+
+    def test_stream(self):
+        data = Generator(self.settings, seed=4).data
+        chunks = list(Generator.stream(self.settings, seed=4, chunkCells=5))
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual(chunks[0].shape, (5, 4))
+        np.testing.assert_array_equal(
+            np.concatenate(chunks),
+            data.reshape(21, 4))
+
+    def test_spawn(self):
+        generators = Generator.spawn(self.settings, 3, seed=5)
+        parallel = Generator.spawn(self.settings, 3, seed=5, processes=2)
+        for generator, other in zip(generators, parallel):
+            np.testing.assert_array_equal(generator.data, other.data)
+        self.assertFalse(np.array_equal(generators[0].data, generators[1].data))
+
+    def test_dtype(self):
+        data = Generator(self.settings, seed=3).data
+        single = Generator(self.settings, seed=3, dtype=np.float32).data
+        self.assertEqual(single.dtype, np.float32)
+        np.testing.assert_array_equal(single, data.astype(np.float32))
+
+    def test_studies(self):
+        settings = Settings(
+            operators=Distribution(3, 0, 0.5),
+            parts=Distribution(10, 100, 2),
+            partOperator=Distribution(30, 0, 0.3),
+            measurements=Distribution(3, 0, 1))
+        data = Generator.studies(settings, 2000, seed=6)
+        self.assertEqual(data.shape, (2000, 3, 10, 3))
+        np.testing.assert_array_equal(data, Generator.studies(settings, 2000, seed=6))
+        g = GageRnR(data)
+        g.calculate()
+        self.assertAlmostEqual(np.mean(g.result[Result.Var][Component.MEASUREMENT]), 1, 1)
+        self.assertAlmostEqual(np.mean(g.result[Result.Var][Component.OPERATOR_BY_PART]), 0.09, 1)
+        self.assertAlmostEqual(np.mean(g.result[Result.Var][Component.PART]), 4, 0)
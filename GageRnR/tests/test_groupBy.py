@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""The GroupBy Tests."""
+import unittest
+from GageRnR import DataLoader, GroupBy, GageRnR, Linearity, Component, Result
+from GageRnR.groupBy import sortLabels
+import numpy as np
+
+partGt = [40, 42, 30, 43, 29, 45, 27.5, 42, 26, 35]
+
+
+class TestGroupBy(unittest.TestCase):
+    """The GroupBy Tests."""
+
+    def setUp(self):
+        self.groups = DataLoader().loadGroups("data/data_groups.csv", skiprows=1)
+
+    def test_loadGroups(self):
+        demo = DataLoader().load("data/data_demoGRnR.csv", [3, 10, 3], [0, 2, 1], ',')
+        self.assertEqual(list(self.groups), ['G1', 'G2'])
+        data, labels = self.groups['G1']
+        self.assertEqual(labels['Operator'], ['C', 'B', 'A'])
+        operators = ['ABC'.index(label) for label in labels['Operator']]
+        parts = [int(label) - 1 for label in labels['Part']]
+        np.testing.assert_array_equal(data, demo[operators][:, parts])
+
+    def test_calculate(self):
+        gb = GroupBy(self.groups)
+        result = gb.calculate()
+        g = GageRnR(self.groups['G2'][0])
+        g.calculate()
+        np.testing.assert_allclose(
+            result['G2']['GageRnR'][Result.Var][Component.PART],
+            g.result[Result.Var][Component.PART])
+        self.assertEqual(set(result['G1']), {'GageRnR', 'Statistics', 'Normality'})
+
+    def test_processes(self):
+        sequential = GroupBy(self.groups).calculate()
+        parallel = GroupBy(self.groups, processes=2).calculate()
+        for name in sequential:
+            np.testing.assert_array_equal(
+                parallel[name]['GageRnR'].values, sequential[name]['GageRnR'].values)
+
+    def test_linearity(self):
+        demo = DataLoader().load("data/data_demoGRnR.csv", [3, 10, 3], [0, 2, 1], ',')
+        lin = Linearity(demo, partGt)
+        lin.calculate()
+        for gt in [partGt, {str(i + 1): value for i, value in enumerate(partGt)}]:
+            result = GroupBy(self.groups, partGt=gt).calculate()['G1']['Linearity']
+            for metric in [Result.K, Result.Bias, Result.P]:
+                np.testing.assert_allclose(
+                    result[metric][Component.TOTAL], lin.result[metric][Component.TOTAL])
+        self.assertRaises(AttributeError, GroupBy, self.groups, partGt=partGt[:-1])
+
+    def test_sortLabels(self):
+        self.assertEqual(sortLabels(['10', '9', '1.5']), ['1.5', '9', '10'])
+        self.assertEqual(sortLabels(['P10', 'P9', 'A']), ['A', 'P10', 'P9'])
+        self.assertEqual(sortLabels(['10', '9', 'A']), ['10', '9', 'A'])
+
+    def test_summary(self):
+        gb = GroupBy(self.groups, partGt=partGt)
+        self.assertRaises(Exception, gb.summary)
+        self.assertIn('G1', str(gb))
+        gb.calculate()
+        self.assertEqual(gb.order(), ['G2', 'G1'])
+        summary = str(gb)
+        self.assertLess(summary.index('G2'), summary.index('G1'))
+        self.assertIn('Linearity', summary)
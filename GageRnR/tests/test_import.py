@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""The Import Tests."""
+import subprocess
+import sys
+import unittest
+
+# Dependencies that should only be loaded when plotting, linearity,
+# reporting or the CLI is used.
+Heavy = ['plotly', 'statsmodels', 'scipy', 'tabulate', 'docopt', 'pkg_resources', 'pandas']
+
+
+def loadedModules(code):
+    """Heavy modules loaded by running code in a fresh interpreter."""
+    script = code + '\nimport sys\nprint(" ".join(m for m in %r if m in sys.modules))' % Heavy
+    output = subprocess.run(
+        [sys.executable, '-c', script], check=True, capture_output=True, text=True).stdout
+    return output.split()
+
+
+class TestImport(unittest.TestCase):
+    """The Import Tests."""
+
+    def test_import(self):
+        self.assertEqual(loadedModules('import GageRnR'), [])
+
+    def test_calculate(self):
+        code = '\n'.join([
+            'from GageRnR import GageRnR, Result, Component',
+            'from GageRnR.tests.data import data',
+            'g = GageRnR(data)',
+            'g.calculate()',
+            'g.result[Result.Var][Component.PART]'])
+        self.assertEqual(loadedModules(code), [])
+
+    def test_lazyAttributes(self):
+        self.assertEqual(loadedModules('from GageRnR import Server'), [])
+        self.assertIn('docopt', loadedModules('from GageRnR import main'))
+        code = 'import GageRnR\nGageRnR.Missing'
+        with self.assertRaises(subprocess.CalledProcessError):
+            loadedModules(code)
@@ -2,6 +2,7 @@ import unittest
 from GageRnR import Normality, Component
 from .data import data
 import numpy as np
+from scipy.stats import shapiro
 
 
 class TestNormality(unittest.TestCase):
@@ -65,3 +66,14 @@ class TestNormality(unittest.TestCase):
         n.calculate()
         n.summary()
         self.assertTrue(True)
+
+    def test_missing(self):
+        missing = data.copy()
+        missing[0, 1, 2] = np.nan
+        n = Normality(missing)
+        W, P = n.calculateNormality()
+
+        present = missing[0][~np.isnan(missing[0])]
+        np.testing.assert_allclose(W[Component.OPERATOR][0], shapiro(present)[0])
+        self.assertTrue(np.all(np.isfinite(W[Component.PART])))
+        self.assertTrue(np.all(np.isfinite(P[Component.TOTAL])))
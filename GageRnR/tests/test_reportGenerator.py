@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""The ReportGenerator Tests."""
+import os
+import tempfile
+import unittest
+from GageRnR import Statistics
+from GageRnR.reportGenerator import ReportGenerator, writeAsset
+from .data import data
+
+
+class TestReportGenerator(unittest.TestCase):
+    """The ReportGenerator Tests."""
+
+    def test_parallelPlots(self):
+        s = Statistics(data)
+        s.calculate()
+        rg = ReportGenerator('build/parallelReport', processes=2)
+        names = ['Plot %d' % i for i in range(4)]
+        for name in names:
+            rg.addTitle(name)
+            rg.addPlot(s.createPartsBoxPlot(), name)
+        rg.generateReport()
+        with open('build/parallelReport/index.html') as f:
+            report = f.read()
+        positions = [report.index('<h1>' + name + '</h1>') for name in names]
+        self.assertEqual(positions, sorted(positions))
+        for name in names:
+            self.assertTrue(os.path.exists('build/parallelReport/' + name + '.html'))
+
+    def test_renderError(self):
+        rg = ReportGenerator('build/parallelReport', processes=1)
+        rg.addPlot('not a figure', 'Broken')
+        self.assertRaises(Exception, rg.generateReport)
+        self.assertIsNone(rg.executor)
+
+    def test_writeAsset(self):
+        def fail():
+            raise OSError('read failed')
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'asset.js')
+            self.assertRaises(OSError, writeAsset, path, fail)
+            self.assertEqual(os.listdir(folder), [])
+            self.assertTrue(writeAsset(path, lambda: 'first'))
+            self.assertFalse(writeAsset(path, lambda: 'second'))
+            with open(path) as f:
+                self.assertEqual(f.read(), 'first')
+
+    def test_outputFolderError(self):
+        with tempfile.TemporaryDirectory() as folder:
+            file = os.path.join(folder, 'file')
+            open(file, 'w').close()
+            self.assertRaises(OSError, ReportGenerator, os.path.join(file, 'report'))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""The ResultTable Tests."""
+import pickle
+import unittest
+from GageRnR import GageRnR, Normality, Linearity, ResultTable, Component, Result
+from .data import data
+import numpy as np
+
+
+class TestResultTable(unittest.TestCase):
+    """The ResultTable Tests."""
+
+    def assertResultEqual(self, table, result):
+        self.assertEqual(list(table), list(result))
+        for key in result:
+            self.assertEqual(set(table[key]), set(result[key]))
+            for comp in result[key]:
+                np.testing.assert_allclose(table[key][comp], result[key][comp])
+                self.assertEqual(np.shape(table[key][comp]), np.shape(result[key][comp]))
+
+    def test_gageRnR(self):
+        """The ResultTable Tests."""
+        g = GageRnR(data)
+        g.calculate()
+        table = g.table()
+        self.assertResultEqual(table, g.result)
+        self.assertNotIn(Component.TOTAL, table[Result.F])
+        self.assertEqual(table.values.shape, (15 + 5 + 3 + 1 + 1 + 1, 9))
+
+    def test_normalityLinearity(self):
+        """The ResultTable Tests."""
+        for analysis in [Normality(data), Linearity(data)]:
+            analysis.calculate()
+            self.assertResultEqual(analysis.table(), analysis.result)
+
+    def test_summary(self):
+        """The ResultTable Tests."""
+        g = GageRnR(data)
+        g.calculate()
+        expected = g.summary()
+        g.result = g.table()
+        self.assertEqual(g.summary(), expected)
+
+    def test_tableException(self):
+        """The ResultTable Tests."""
+        self.assertRaises(Exception, GageRnR(data).table)
+
+    def test_stack(self):
+        """The ResultTable Tests."""
+        tables = []
+        for scale in [1, 2, 3]:
+            g = GageRnR(data * scale)
+            g.calculate()
+            tables.append(g.table())
+        stacked = ResultTable.stack(tables)
+        self.assertEqual(stacked.batch, (3,))
+        np.testing.assert_allclose(
+            stacked[Result.Var][GageRnR.GRR],
+            [tables[0][Result.Var][GageRnR.GRR] * s**2 for s in [1, 2, 3]])
+        self.assertResultEqual(stacked.study(1), tables[1])
+        self.assertTrue(np.shares_memory(stacked.study(1).values, stacked.values))
+        self.assertFalse(np.shares_memory(stacked.values, tables[1].values))
+
+    def test_batchMatchesStack(self):
+        """The ResultTable Tests."""
+        g = GageRnR(np.stack([data, data * 2]))
+        g.calculate()
+        tables = []
+        for scale in [1, 2]:
+            single = GageRnR(data * scale)
+            single.calculate()
+            tables.append(single.table())
+        np.testing.assert_allclose(g.table().values, ResultTable.stack(tables).values)
+
+    def test_stackLayoutMismatch(self):
+        """The ResultTable Tests."""
+        g = GageRnR(data)
+        g.calculate()
+        n = Normality(data)
+        n.calculate()
+        self.assertRaises(AttributeError, ResultTable.stack, [g.table(), n.table()])
+
+    def test_pickle(self):
+        """The ResultTable Tests."""
+        g = GageRnR(data)
+        g.calculate()
+        table = pickle.loads(pickle.dumps(g.table()))
+        self.assertResultEqual(table, g.result)
+
+    def test_mapping(self):
+        """The ResultTable Tests."""
+        g = GageRnR(data)
+        g.calculate()
+        table = g.table()
+        self.assertEqual(list(table.toDict()), list(g.result))
+        self.assertEqual(table.toDict()[Result.F], dict(table[Result.F]))
+        self.assertRaises(KeyError, table.__getitem__, 'Unknown')
+        self.assertRaises(KeyError, table[Result.F].__getitem__, Component.TOTAL)
+        self.assertEqual(len(table[Result.F]), len(g.result[Result.F]))
+        self.assertTrue(repr(table).startswith('ResultTable({'))
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""The Server Tests."""
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr
+from unittest.mock import patch
+from urllib.error import HTTPError
+from urllib.request import urlopen
+import io
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+import zipfile
+from GageRnR import Server, DataLoader, GageRnR, Component, Result, main
+from GageRnR.server import analyse
+import numpy as np
+
+query = 'structure=3,10,3&axes=0,2,1'
+
+
+class TestServer(unittest.TestCase):
+    """The Server Tests."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = Server(port=0, processes=2, quiet=True)
+        cls.thread = threading.Thread(target=cls.server.serveForever)
+        cls.thread.start()
+        host, port = cls.server.address
+        cls.url = 'http://%s:%d' % (host, port)
+        with open("data/data_demoGRnR.csv", 'rb') as f:
+            cls.csv = f.read()
+        cls.data = DataLoader().load("data/data_demoGRnR.csv", [3, 10, 3], [0, 2, 1], ',')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.thread.join()
+
+    def post(self, path, payload):
+        with urlopen(self.url + path, data=payload) as response:
+            return response.headers['Content-Type'], response.read()
+
+    def test_health(self):
+        with urlopen(self.url + '/health') as response:
+            self.assertEqual(json.load(response)['status'], 'ok')
+
+    def test_analyse(self):
+        contentType, body = self.post('/analyse?' + query, self.csv)
+        self.assertEqual(contentType, 'application/json')
+        result = json.loads(body)
+        g = GageRnR(self.data)
+        g.calculate()
+        self.assertAlmostEqual(
+            result['GageRnR']['Var']['Part'], g.result[Result.Var][Component.PART])
+        self.assertAlmostEqual(
+            result['GageRnR']['Percent'][GageRnR.GRR], g.result[Result.Percent][GageRnR.GRR])
+        self.assertEqual(set(result), {'GageRnR', 'Statistics', 'Normality'})
+
+    def test_analyseBinary(self):
+        payload = io.BytesIO()
+        np.save(payload, self.data)
+        _, body = self.post('/analyse?format=npy&structure=3,10,3', payload.getvalue())
+        _, expected = self.post('/analyse?' + query, self.csv)
+        self.assertEqual(json.loads(body)['GageRnR'], json.loads(expected)['GageRnR'])
+
+    def test_concurrent(self):
+        with ThreadPoolExecutor(4) as executor:
+            bodies = list(executor.map(
+                lambda i: self.post('/analyse?' + query, self.csv)[1], range(8)))
+        self.assertEqual(len(set(bodies)), 1)
+
+    def test_report(self):
+        contentType, body = self.post(
+            '/analyse?report=1&groundTruth=40,42,30,43,29,45,27.5,42,26,35&' + query, self.csv)
+        self.assertEqual(contentType, 'application/zip')
+        names = zipfile.ZipFile(io.BytesIO(body)).namelist()
+        self.assertIn('index.html', names)
+        self.assertIn('Residual Linearity Plot.html', names)
+
+    def test_errors(self):
+        for path in ['/analyse', '/analyse?format=xml&structure=3,10,3', '/unknown']:
+            with self.assertRaises(HTTPError) as context:
+                self.post(path, self.csv)
+            self.assertIn('error', json.load(context.exception))
+        with self.assertRaises(HTTPError) as context:
+            urlopen(self.url + '/unknown')
+        self.assertEqual(context.exception.code, 404)
+
+
+class TestServerInThread(unittest.TestCase):
+    """The Server Tests."""
+
+    def test_analyse(self):
+        server = Server(port=0)
+        thread = threading.Thread(target=server.serveForever)
+        thread.start()
+        log = io.StringIO()
+        try:
+            with open("data/data_demoGRnR.csv", 'rb') as f, redirect_stderr(log):
+                url = 'http://%s:%d/analyse?%s' % (server.address + (query,))
+                with urlopen(url, data=f.read()) as response:
+                    result = json.load(response)
+        finally:
+            server.shutdown()
+            thread.join()
+        self.assertIn('GageRnR', result)
+        self.assertIn('POST /analyse', log.getvalue())
+
+    def test_analyseFunction(self):
+        with open("data/data_demoGRnR.csv", 'rb') as f:
+            payload = f.read()
+        query = {'structure': '3,10,3', 'axes': '0,2,1', 'delimiter': ','}
+        contentType, _ = analyse(payload, query)
+        self.assertEqual(contentType, 'application/json')
+        contentType, body = analyse(payload, dict(query, report='1'))
+        self.assertEqual(contentType, 'application/zip')
+        self.assertIn('index.html', zipfile.ZipFile(io.BytesIO(body)).namelist())
+        self.assertRaises(AttributeError, analyse, payload, {})
+        self.assertRaises(AttributeError, analyse, payload, dict(query, format='xml'))
+
+    def test_serveCli(self):
+        with patch.object(Server, 'serveForever', autospec=True, side_effect=Server.close) as serve:
+            main(['--serve', '--port', '0', '-j', '1'])
+        server = serve.call_args[0][0]
+        self.assertEqual(server.address[0], '127.0.0.1')
+        self.assertIsNotNone(server.executor)
+
+
+class TestUnixServer(unittest.TestCase):
+    """The Server Tests."""
+
+    def test_socket(self):
+        log = io.StringIO()
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'gagernr.sock')
+            # A socket file left by an earlier server is replaced.
+            open(path, 'w').close()
+            server = Server(socket=path)
+            thread = threading.Thread(target=server.serveForever)
+            thread.start()
+            try:
+                client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                client.connect(path)
+                with redirect_stderr(log):
+                    client.sendall(b'GET /health HTTP/1.0\r\n\r\n')
+                    response = b''
+                    for chunk in iter(lambda: client.recv(4096), b''):
+                        response += chunk
+                client.close()
+            finally:
+                server.shutdown()
+                thread.join()
+        self.assertIn(b'200', response.split(b'\r\n')[0])
+        self.assertIn(b'"ok"', response)
+        self.assertTrue(log.getvalue().startswith('unix'))
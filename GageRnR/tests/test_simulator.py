@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""The Simulator Tests."""
+import unittest
+from GageRnR import Distribution, Settings, Simulator, GageRnR, Component, Result
+import numpy as np
+
+
+class TestSimulator(unittest.TestCase):
+    """The Simulator Tests."""
+
+    def setUp(self):
+        self.settings = Settings(
+            operators=Distribution(3, 0, 0.5),
+            parts=Distribution(10, 100, 2),
+            partOperator=Distribution(30, 0, 0.1),
+            measurements=Distribution(3, 0, 1))
+
+    def test_defaultDesign(self):
+        s = Simulator(self.settings, studies=10)
+        self.assertEqual(s.designs, [(3, 10, 3)])
+
+    def test_samplingDistribution(self):
+        designs = [(2, 5, 2), (3, 10, 3)]
+        s = Simulator(self.settings, designs=designs, studies=3000, seed=1)
+        result = s.calculate()
+
+        for design in designs:
+            Var = result[design][Result.Var]
+            self.assertEqual(Var[GageRnR.GRR].shape, (3000,))
+            self.assertAlmostEqual(np.mean(Var[Component.MEASUREMENT]), 1, 1)
+            self.assertAlmostEqual(np.mean(Var[Component.PART]), 4, 0)
+
+        spread = [np.std(result[design][Result.Percent][GageRnR.GRR]) for design in designs]
+        self.assertGreater(spread[0], spread[1])
+
+    def test_seed(self):
+        first = Simulator(self.settings, studies=600, seed=2).calculate()
+        second = Simulator(self.settings, studies=600, seed=2, processes=2).calculate()
+        np.testing.assert_array_equal(
+            first[(3, 10, 3)][Result.Var][GageRnR.GRR],
+            second[(3, 10, 3)][Result.Var][GageRnR.GRR])
+
+    def test_tasks(self):
+        s = Simulator(self.settings, designs=[(2, 5, 2)], studies=1000, seed=3)
+        tasks = s.createTasks()
+        self.assertEqual(sum(task[2] for task in tasks), 1000)
+        self.assertEqual(len(tasks), 4)
+
+    def test_str(self):
+        s = Simulator(self.settings, studies=10)
+        s.__str__()
+        self.assertTrue(True)
+
+    def test_summaryException(self):
+        s = Simulator(self.settings, studies=10)
+        self.assertRaises(Exception, s.summary)
+
+    def test_summary(self):
+        s = Simulator(self.settings, studies=10)
+        s.calculate()
+        s.__str__()
+        s.summary(result=Result.Var)
+        self.assertTrue(True)
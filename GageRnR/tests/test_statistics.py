@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """The GageRnR Tests."""
 import unittest
-from GageRnR import Statistics, Component
+from GageRnR import Statistics, Component, Result
 from .data import data
 import numpy as np
 
@@ -78,3 +78,23 @@ class TestStatistics(unittest.TestCase):
                               "Part": ["O", "P", "Q", "R", "S"]})
         s.calculate()
         self.assertTrue(True)
+
+    def test_missing(self):
+        missing = data.copy()
+        missing[0, 1, 2] = np.nan
+        missing[1, 1, 0] = np.nan
+        s = Statistics(missing)
+        s.calculate()
+
+        np.testing.assert_allclose(
+            s.result[Result.Mean][Component.TOTAL], [np.nanmean(missing)])
+        np.testing.assert_allclose(
+            s.result[Result.Mean][Component.PART], np.nanmean(missing, axis=(0, 2)))
+        np.testing.assert_allclose(
+            s.result[Result.Std][Component.TOTAL], [np.nanstd(missing, ddof=1)])
+        np.testing.assert_allclose(
+            s.result[Result.Std][Component.OPERATOR],
+            [np.nanstd(missing[i], ddof=1) for i in range(3)])
+        np.testing.assert_allclose(
+            s.result[Result.Std][Component.PART],
+            [np.nanstd(missing[:, i], ddof=1) for i in range(5)])
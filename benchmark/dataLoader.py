@@ -0,0 +1,57 @@
+"""Benchmark the DataLoader text parsers against np.loadtxt.
+
+Writes csv files of random measurements with 30 values per row and
+reports the best wall time of every parser in seconds.
+
+Usage:
+    dataLoader.py [-s <SIZES>] [-t <THREADS>] [-r <REPEAT>]
+
+Options:
+    -s --sizes=<SIZES>  Number of values of every file [default: 10000,100000,1000000].
+    -t --threads=<THREADS>  Threads of the threaded parsers [default: 4].
+    -r --repeat=<REPEAT>  Runs of every parser [default: 3].
+"""
+import os.path
+import tempfile
+import timeit
+from docopt import docopt
+from tabulate import tabulate
+import numpy as np
+from GageRnR import DataLoader
+
+COLUMNS = 30
+
+
+def parsers(threads):
+    loader = DataLoader()
+    return {
+        'np.loadtxt': lambda file: np.loadtxt(file, delimiter=','),
+        'numpy': lambda file: loader.parse(file, ',', engine='numpy'),
+        'numpy threads': lambda file: loader.parse(file, ',', engine='numpy', threads=threads),
+        'pandas': lambda file: loader.parse(file, ',', engine='pandas'),
+        'pandas threads': lambda file: loader.parse(file, ',', engine='pandas', threads=threads)}
+
+
+def main():
+    arguments = docopt(__doc__)
+    sizes = [int(size) for size in arguments['--sizes'].split(',')]
+    repeat = int(arguments['--repeat'])
+    functions = parsers(int(arguments['--threads']))
+
+    table = []
+    with tempfile.TemporaryDirectory() as folder:
+        for size in sizes:
+            file = os.path.join(folder, 'data.csv')
+            values = np.random.default_rng(0).normal(100, 3, (size // COLUMNS, COLUMNS))
+            np.savetxt(file, values, delimiter=',')
+            row = [size, '%.1f' % (os.path.getsize(file) / 2**20)]
+            for function in functions.values():
+                row.append('%.3f' % min(timeit.repeat(
+                    lambda: function(file), number=1, repeat=repeat)))
+            table.append(row)
+
+    print(tabulate(table, headers=['Values', 'MB'] + list(functions)))
+
+
+if __name__ == '__main__':
+    main()
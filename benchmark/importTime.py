@@ -0,0 +1,55 @@
+"""Benchmark the time of importing GageRnR in a fresh interpreter.
+
+Reports the best wall time of every import in seconds and exits with
+an error when importing the core package exceeds the budget, so the
+plotting, regression and CLI dependencies stay out of it.
+
+Usage:
+    importTime.py [-b <BUDGET>] [-r <REPEAT>]
+
+Options:
+    -b --budget=<BUDGET>  Budget of the core import in seconds [default: 0.5].
+    -r --repeat=<REPEAT>  Runs of every import [default: 5].
+"""
+import subprocess
+import sys
+import time
+from docopt import docopt
+from tabulate import tabulate
+
+IMPORTS = {
+    'numpy': 'import numpy',
+    'GageRnR': 'import GageRnR',
+    'GageRnR calculate': 'import GageRnR\n'
+                         'from GageRnR.tests.data import data\n'
+                         'GageRnR.GageRnR(data).calculate()[GageRnR.Result.Var]',
+    'GageRnR CLI': 'from GageRnR import main',
+    'GageRnR report': 'from GageRnR import main\n'
+                      'import plotly.graph_objects, statsmodels.api, scipy.stats',
+}
+
+
+def importTime(code, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    arguments = docopt(__doc__)
+    budget = float(arguments['--budget'])
+    repeat = int(arguments['--repeat'])
+
+    baseline = importTime('pass', repeat)
+    times = {name: importTime(code, repeat) - baseline for name, code in IMPORTS.items()}
+    print(tabulate([[name, '%.3f' % t] for name, t in times.items()], headers=['Import', 'Seconds']))
+
+    if times['GageRnR'] > budget:
+        sys.exit('import GageRnR took %.3f s, the budget is %.3f s' % (times['GageRnR'], budget))
+
+
+if __name__ == '__main__':
+    main()
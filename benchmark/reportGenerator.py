@@ -0,0 +1,63 @@
+"""Benchmark rendering the plots of a report serially and on worker processes.
+
+Generates a random study and writes a report with the parts and
+operators box plots repeated, reporting the best wall time of every
+number of processes in seconds.
+
+Usage:
+    reportGenerator.py [-s <STRUCTURE>] [-n <PLOTS>] [-p <PROCESSES>] [-r <REPEAT>]
+
+Options:
+    -s --structure=<STRUCTURE>  Operators, parts and measurements [default: 5,200,10].
+    -n --plots=<PLOTS>  Number of plots of the report [default: 8].
+    -p --processes=<PROCESSES>  Processes rendering the plots, 0 is serial [default: 0,2,4].
+    -r --repeat=<REPEAT>  Runs of every configuration [default: 3].
+"""
+import tempfile
+import timeit
+from docopt import docopt
+from tabulate import tabulate
+from GageRnR import Distribution, Generator, Settings, Statistics
+from GageRnR.reportGenerator import ReportGenerator
+
+
+def writeReport(folder, statistics, plots, processes):
+    rg = ReportGenerator(folder, processes=processes or None)
+    for i in range(plots):
+        rg.addTitle('Plot %d' % i)
+        if i % 2:
+            rg.addPlot(statistics.createOperatorsBoxPlot(), 'Operators %d' % i)
+        else:
+            rg.addPlot(statistics.createPartsBoxPlot(), 'Parts %d' % i)
+    rg.generateReport()
+
+
+def main():
+    arguments = docopt(__doc__)
+    operators, parts, measurements = [int(v) for v in arguments['--structure'].split(',')]
+    plots = int(arguments['--plots'])
+    repeat = int(arguments['--repeat'])
+
+    settings = Settings(
+        Distribution(operators, 0, 1),
+        Distribution(parts, 100, 5),
+        Distribution(operators * parts, 0, 0.5),
+        Distribution(measurements, 0, 1))
+    statistics = Statistics(Generator(settings, seed=0).data)
+    statistics.calculate()
+
+    table = []
+    with tempfile.TemporaryDirectory() as folder:
+        # Write the shared assets before timing.
+        writeReport(folder, statistics, 1, 0)
+        for processes in [int(p) for p in arguments['--processes'].split(',')]:
+            seconds = min(timeit.repeat(
+                lambda: writeReport(folder, statistics, plots, processes),
+                number=1, repeat=repeat))
+            table.append([processes or 'serial', '%.3f' % seconds])
+
+    print(tabulate(table, headers=['Processes', 'Seconds']))
+
+
+if __name__ == '__main__':
+    main()